@@ -1,19 +1,44 @@
 """Add SL/TP to existing positions without stop loss."""
 import asyncio
-from src.config import Config
-from src.hyperliquid.client import HyperliquidClient
+import numpy as np
+from src.config import config
+from src.hyperliquid.client import HyperliquidClient, shared_client
+
+# Price multipliers on entry: [SL, TP1, TP2, TP3] (2% SL, 2%/4%/6% TPs)
+LONG_MULT = np.array([0.98, 1.02, 1.04, 1.06])   # LONG: SL below, TP above
+SHORT_MULT = np.array([1.02, 0.98, 0.96, 0.94])  # SHORT: SL above, TP below
+
+# Position fraction closed at each TP: 50% at TP1, 30% at TP2, 20% at TP3
+TP_SIZE_FRACS = np.array([0.5, 0.3, 0.2])
+
+
+async def place_for_position(client: HyperliquidClient, position, orders):
+    """Place the SL and all TP orders for one position concurrently."""
+    return await asyncio.gather(
+        *[
+            client.place_trigger_order(
+                asset=position.asset,
+                side=side,
+                size=size,
+                trigger_price=price,
+                trigger_type=trigger_type,
+                is_market=True
+            )
+            for _, side, size, price, trigger_type in orders
+        ],
+        return_exceptions=True
+    )
 
 
 async def add_sl_tp_to_positions():
     """Add Stop Loss and Take Profit to existing open positions."""
-    config = Config()
-
-    async with HyperliquidClient(config.hyperliquid) as client:
+    async with shared_client(config.hyperliquid) as client:
         print("Fetching current positions...")
         portfolio = await client.get_account_state()
 
         print(f"\nFound {len(portfolio.positions)} open positions:\n")
 
+        orders_by_position = []
         for position in portfolio.positions:
             print(f"{'='*80}")
             print(f"Asset: {position.asset}")
@@ -24,27 +49,16 @@ async def add_sl_tp_to_positions():
             print(f"PnL: {position.unrealized_pnl_percent:.2f}%")
 
             # Calculate SL and TP prices based on position side
+            # Orders are opposite of position side
             if position.side == "LONG":
-                # For LONG: SL below, TP above
-                sl_price = position.entry_price * 0.98  # 2% stop loss
-                tp1_price = position.entry_price * 1.02  # 2% take profit
-                tp2_price = position.entry_price * 1.04  # 4% take profit
-                tp3_price = position.entry_price * 1.06  # 6% take profit
-
-                # Orders are opposite of position side
-                sl_side = "SELL"
-                tp_side = "SELL"
-
+                multipliers = LONG_MULT
+                close_side = "SELL"
             else:  # SHORT
-                # For SHORT: SL above, TP below
-                sl_price = position.entry_price * 1.02  # 2% stop loss
-                tp1_price = position.entry_price * 0.98  # 2% take profit
-                tp2_price = position.entry_price * 0.96  # 4% take profit
-                tp3_price = position.entry_price * 0.94  # 6% take profit
+                multipliers = SHORT_MULT
+                close_side = "BUY"
 
-                # Orders are opposite of position side
-                sl_side = "BUY"
-                tp_side = "BUY"
+            sl_price, tp1_price, tp2_price, tp3_price = (position.entry_price * multipliers).tolist()
+            tp1_size, tp2_size, tp3_size = (position.size * TP_SIZE_FRACS).tolist()
 
             print(f"\nPlacing orders for {position.asset} {position.side}:")
             print(f"  Stop Loss @ ${sl_price:,.2f} (2%)")
@@ -52,40 +66,34 @@ async def add_sl_tp_to_positions():
             print(f"  TP2 @ ${tp2_price:,.2f} (4%)")
             print(f"  TP3 @ ${tp3_price:,.2f} (6%)")
 
-            # Place Stop Loss
-            try:
-                sl_result = await client.place_trigger_order(
-                    asset=position.asset,
-                    side=sl_side,
-                    size=position.size,
-                    trigger_price=sl_price,
-                    trigger_type="sl",
-                    is_market=True
-                )
-                print(f"✅ Stop Loss placed: {sl_result}")
-            except Exception as e:
-                print(f"❌ Failed to place Stop Loss: {e}")
-
-            # Place Take Profit orders (split position)
-            tp_sizes = [
-                (position.size * 0.5, tp1_price, "TP1"),   # 50% at TP1
-                (position.size * 0.3, tp2_price, "TP2"),   # 30% at TP2
-                (position.size * 0.2, tp3_price, "TP3"),   # 20% at TP3
-            ]
-
-            for tp_size, tp_price, tp_name in tp_sizes:
-                try:
-                    tp_result = await client.place_trigger_order(
-                        asset=position.asset,
-                        side=tp_side,
-                        size=tp_size,
-                        trigger_price=tp_price,
-                        trigger_type="tp",
-                        is_market=True
-                    )
-                    print(f"✅ {tp_name} placed: {tp_result}")
-                except Exception as e:
-                    print(f"❌ Failed to place {tp_name}: {e}")
+            # Stop Loss on the full size, Take Profit split across the position
+            orders_by_position.append([
+                ("Stop Loss", close_side, position.size, sl_price, "sl"),
+                ("TP1", close_side, tp1_size, tp1_price, "tp"),
+                ("TP2", close_side, tp2_size, tp2_price, "tp"),
+                ("TP3", close_side, tp3_size, tp3_price, "tp"),
+            ])
+
+        # Dispatch every trigger order for every position at once
+        results = await asyncio.gather(
+            *[
+                place_for_position(client, position, orders)
+                for position, orders in zip(portfolio.positions, orders_by_position)
+            ],
+            return_exceptions=True
+        )
+
+        for position, orders, position_results in zip(portfolio.positions, orders_by_position, results):
+            print(f"\n{position.asset} {position.side}:")
+            if isinstance(position_results, Exception):
+                print(f"❌ Failed to place orders: {position_results}")
+                continue
+
+            for (name, *_), result in zip(orders, position_results):
+                if isinstance(result, Exception):
+                    print(f"❌ Failed to place {name}: {result}")
+                else:
+                    print(f"✅ {name} placed: {result}")
 
         print(f"\n{'='*80}")
         print("Done! All positions now have SL/TP orders.")
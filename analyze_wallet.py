@@ -1,12 +1,79 @@
 """Analyze trading activity of a Hyperliquid wallet."""
 
 import asyncio
+import io
+import logging
+import os
+import sys
+import time
 import aiohttp
-from datetime import datetime
-from typing import List, Dict, Any
-from collections import defaultdict
+from typing import List, Dict, Any, Optional, TextIO, Tuple
+from dataclasses import dataclass
 import json
 
+import numpy as np
+import orjson
+import pandas as pd
+from dateutil.tz import tzlocal
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class FillsSoA:
+    """Fills as parallel arrays (one entry per fill)."""
+
+    coin: np.ndarray
+    px: np.ndarray
+    sz: np.ndarray
+    fee: np.ndarray
+    time: np.ndarray
+
+
+@dataclass
+class FundingSoA:
+    """Funding payments as parallel arrays (one entry per payment)."""
+
+    coin: np.ndarray
+    usdc: np.ndarray
+
+
+def _fills_to_soa(fills: List[Dict[str, Any]]) -> FillsSoA:
+    """Read every fill dict once into contiguous arrays."""
+    rows = [
+        (fill.get('coin', 'UNKNOWN'), fill.get('px', 0), fill.get('sz', 0), fill.get('fee', 0),
+         fill.get('time') or np.nan)  # Missing times don't count
+        for fill in fills
+    ]
+    coin, px, sz, fee, times = zip(*rows) if rows else ((),) * 5
+    return FillsSoA(
+        coin=np.array(coin, dtype=object),
+        px=np.array(px, dtype=np.float64),
+        sz=np.array(sz, dtype=np.float64),
+        fee=np.abs(np.array(fee, dtype=np.float64)),
+        time=np.array(times, dtype=np.float64),
+    )
+
+
+def _funding_to_soa(funding: List[Dict[str, Any]]) -> FundingSoA:
+    """Read every funding dict once into contiguous arrays."""
+    rows = [(payment.get('coin', 'UNKNOWN'), payment.get('usdc', 0)) for payment in funding]
+    coin, usdc = zip(*rows) if rows else ((),) * 2
+    return FundingSoA(coin=np.array(coin, dtype=object), usdc=np.array(usdc, dtype=np.float64))
+
+
+def _format_ms(ms: np.ndarray) -> np.ndarray:
+    """Format epoch-ms timestamps as local 'YYYY-MM-DD HH:MM:SS' strings ("N/A" for NaN)."""
+    stamps = pd.to_datetime(ms, unit='ms', utc=True).tz_convert(tzlocal())
+    return np.where(np.isnan(ms), "N/A", np.asarray(stamps.strftime('%Y-%m-%d %H:%M:%S'), dtype=object))
+
+
+def _fills_fingerprint(fills: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """Cheap identity for a fills list: count plus first and last trade time."""
+    if not fills:
+        return (0, 0, 0)
+    return (len(fills), fills[0].get('time', 0), fills[-1].get('time', 0))
+
 
 class WalletAnalyzer:
     """Analyze trading activity of a Hyperliquid wallet."""
@@ -15,9 +82,16 @@ class WalletAnalyzer:
         self.wallet_address = wallet_address
         self.base_url = "https://api.hyperliquid-testnet.xyz" if testnet else "https://api.hyperliquid.xyz"
         self.session = None
+        self._fills_cache: Dict[Tuple[int, int, int], Dict[str, Any]] = {}
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # One pooled session for the analyzer lifetime: keep-alive and DNS cache
+        # avoid a fresh TCP/TLS handshake for every /info call
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300,
+                                         keepalive_timeout=30, enable_cleanup_closed=True)
+        timeout = aiohttp.ClientTimeout(total=30, connect=5)
+        self.session = aiohttp.ClientSession(base_url=self.base_url, connector=connector, timeout=timeout,
+                                             headers={"Content-Type": "application/json"})
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -26,12 +100,9 @@ class WalletAnalyzer:
 
     async def _request(self, endpoint: str, data: Dict[str, Any]) -> Any:
         """Make API request."""
-        url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
-
-        async with self.session.post(url, json=data, headers=headers) as response:
+        async with self.session.post(endpoint, json=data) as response:
             response.raise_for_status()
-            return await response.json()
+            return orjson.loads(await response.read())
 
     async def get_user_fills(self) -> List[Dict[str, Any]]:
         """Get all user fills (executed trades)."""
@@ -42,9 +113,8 @@ class WalletAnalyzer:
 
         try:
             response = await self._request("/info", data)
-            print(f"DEBUG: User fills response type: {type(response)}, length: {len(response) if isinstance(response, list) else 'N/A'}")
-            if isinstance(response, list) and len(response) > 0:
-                print(f"DEBUG: First fill: {response[0]}")
+            if log.isEnabledFor(logging.DEBUG) and isinstance(response, list):
+                log.debug("User fills length=%d first=%s", len(response), response[0] if response else None)
             return response if response else []
         except Exception as e:
             print(f"Error fetching user fills: {e}")
@@ -78,20 +148,22 @@ class WalletAnalyzer:
             print(f"Error fetching account state: {e}")
             return {}
 
-    async def get_user_non_funding_ledger(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get user ledger updates (deposits, withdrawals, PnL)."""
+    async def get_user_non_funding_ledger(self, limit: int = 100, since_days: int = 90) -> List[Dict[str, Any]]:
+        """Get the most recent user ledger updates (deposits, withdrawals, PnL) within since_days."""
+        # Let the server apply the time window instead of downloading the whole history
+        now_ms = int(time.time() * 1000)
         data = {
             "type": "userNonFundingLedgerUpdates",
             "user": self.wallet_address,
-            "startTime": 0  # Get all history
+            "startTime": now_ms - since_days * 86_400_000,
+            "endTime": now_ms
         }
 
         try:
             response = await self._request("/info", data)
-            print(f"DEBUG: Ledger response length: {len(response) if isinstance(response, list) else 'N/A'}")
-            if isinstance(response, list) and len(response) > 0:
-                print(f"DEBUG: Recent ledger entries: {response[:3]}")
-            return response[:limit] if response else []
+            if log.isEnabledFor(logging.DEBUG) and isinstance(response, list):
+                log.debug("Ledger length=%d recent=%s", len(response), response[:3])
+            return response[-limit:] if response else []
         except Exception as e:
             print(f"Error fetching ledger: {e}")
             return []
@@ -119,9 +191,8 @@ class WalletAnalyzer:
 
         try:
             response = await self._request("/info", data)
-            print(f"DEBUG: Spot fills response length: {len(response) if isinstance(response, list) else 'N/A'}")
-            if isinstance(response, list) and len(response) > 0:
-                print(f"DEBUG: First spot fill: {response[0]}")
+            if log.isEnabledFor(logging.DEBUG) and isinstance(response, list):
+                log.debug("Spot fills length=%d first=%s", len(response), response[0] if response else None)
             return response if response else []
         except Exception as e:
             print(f"Error fetching spot fills: {e}")
@@ -135,68 +206,57 @@ class WalletAnalyzer:
                 "message": "No trades found"
             }
 
-        # Group trades by asset
-        trades_by_asset = defaultdict(list)
-        total_volume = 0.0
-        total_fee = 0.0
-
-        for fill in fills:
-            coin = fill.get('coin', 'UNKNOWN')
-            trades_by_asset[coin].append(fill)
-
-            # Calculate volume
-            px = float(fill.get('px', 0))
-            sz = abs(float(fill.get('sz', 0)))
-            volume = px * sz
-            total_volume += volume
-
-            # Sum fees
-            fee = abs(float(fill.get('fee', 0)))
-            total_fee += fee
+        # analyze_fills is pure, so reruns on the same fills are served from cache
+        fingerprint = _fills_fingerprint(fills)
+        cached = self._fills_cache.get(fingerprint)
+        if cached is not None:
+            return cached
+
+        # Single pass from dicts into arrays so all sums run in C
+        soa = _fills_to_soa(fills)
+        vol = soa.px * np.abs(soa.sz)
+
+        # Group by asset: one stable sort, then reduce each contiguous coin slice
+        by_coin = np.argsort(soa.coin, kind='stable')
+        coin_sorted = soa.coin[by_coin]
+        boundaries = np.flatnonzero(np.r_[True, coin_sorted[1:] != coin_sorted[:-1]])
+        names = coin_sorted[boundaries]
+        first_seen = by_coin[boundaries]  # Stable sort keeps each coin's first fill at its slice start
+        trade_counts = np.diff(np.r_[boundaries, len(coin_sorted)])
+        buy_counts = np.add.reduceat((soa.sz[by_coin] > 0).astype(np.int64), boundaries)
+        volumes = np.add.reduceat(vol[by_coin], boundaries)
+        fees = np.add.reduceat(soa.fee[by_coin], boundaries)
+        first_trades = np.fmin.reduceat(soa.time[by_coin], boundaries)
+        last_trades = np.fmax.reduceat(soa.time[by_coin], boundaries)
+
+        # Calculate statistics per asset, sorted by volume
+        order = np.argsort(first_seen)
+        order = order[np.argsort(-volumes[order], kind='stable')]
+
+        first_trade_str = _format_ms(first_trades)
+        last_trade_str = _format_ms(last_trades)
 
-        # Calculate statistics per asset
         asset_stats = {}
-        for coin, coin_fills in trades_by_asset.items():
-            total_trades = len(coin_fills)
-            buys = sum(1 for f in coin_fills if float(f.get('sz', 0)) > 0)
-            sells = total_trades - buys
-
-            coin_volume = sum(
-                float(f.get('px', 0)) * abs(float(f.get('sz', 0)))
-                for f in coin_fills
-            )
-
-            coin_fees = sum(abs(float(f.get('fee', 0))) for f in coin_fills)
-
-            # Get first and last trade times
-            timestamps = [f.get('time', 0) for f in coin_fills if f.get('time')]
-            first_trade = min(timestamps) if timestamps else 0
-            last_trade = max(timestamps) if timestamps else 0
-
-            asset_stats[coin] = {
-                "total_trades": total_trades,
-                "buys": buys,
-                "sells": sells,
-                "volume_usd": coin_volume,
-                "fees_paid": coin_fees,
-                "first_trade": datetime.fromtimestamp(first_trade / 1000).strftime('%Y-%m-%d %H:%M:%S') if first_trade else "N/A",
-                "last_trade": datetime.fromtimestamp(last_trade / 1000).strftime('%Y-%m-%d %H:%M:%S') if last_trade else "N/A",
+        for i in order:
+            asset_stats[names[i]] = {
+                "total_trades": int(trade_counts[i]),
+                "buys": int(buy_counts[i]),
+                "sells": int(trade_counts[i] - buy_counts[i]),
+                "volume_usd": float(volumes[i]),
+                "fees_paid": float(fees[i]),
+                "first_trade": first_trade_str[i],
+                "last_trade": last_trade_str[i],
             }
 
-        # Sort assets by volume
-        sorted_assets = sorted(
-            asset_stats.items(),
-            key=lambda x: x[1]['volume_usd'],
-            reverse=True
-        )
-
-        return {
+        result = {
             "total_trades": len(fills),
-            "total_volume_usd": total_volume,
-            "total_fees_paid": total_fee,
-            "unique_assets": len(trades_by_asset),
-            "assets": dict(sorted_assets)
+            "total_volume_usd": float(vol.sum()),
+            "total_fees_paid": float(soa.fee.sum()),
+            "unique_assets": len(names),
+            "assets": asset_stats
         }
+        self._fills_cache[fingerprint] = result
+        return result
 
     def analyze_funding(self, funding: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze funding payments."""
@@ -207,30 +267,32 @@ class WalletAnalyzer:
                 "message": "No funding data found"
             }
 
-        total_funding = 0.0
-        funding_by_asset = defaultdict(float)
+        soa = _funding_to_soa(funding)
+        total_funding = float(soa.usdc.sum())
 
-        for payment in funding:
-            coin = payment.get('coin', 'UNKNOWN')
-            usdc = float(payment.get('usdc', 0))
-            total_funding += usdc
-            funding_by_asset[coin] += usdc
+        # Per-asset totals via integer codes, keeping first-appearance order
+        names, first_seen, codes = np.unique(soa.coin, return_index=True, return_inverse=True)
+        per_asset = np.bincount(codes, weights=soa.usdc, minlength=len(names))
+        order = np.argsort(first_seen)
+        funding_by_asset = dict(zip(names[order].tolist(), per_asset[order].tolist()))
 
         return {
             "total_payments": len(funding),
             "net_funding_usd": total_funding,
             "net_funding_received" if total_funding > 0 else "net_funding_paid": abs(total_funding),
-            "funding_by_asset": dict(funding_by_asset)
+            "funding_by_asset": funding_by_asset
         }
 
     def print_analysis(self, fills_analysis: Dict, funding_analysis: Dict, account_state: Dict,
-                       ledger: List[Dict], spot_state: Dict):
-        """Print formatted analysis."""
-        print("=" * 80)
-        print(f"HYPERLIQUID WALLET ANALYSIS")
-        print(f"Wallet: {self.wallet_address}")
-        print("=" * 80)
-        print()
+                       ledger: List[Dict], spot_state: Dict, out: Optional[TextIO] = None):
+        """Print formatted analysis (buffered and written to out/stdout in one go)."""
+        buf = io.StringIO()
+
+        print("=" * 80, file=buf)
+        print(f"HYPERLIQUID WALLET ANALYSIS", file=buf)
+        print(f"Wallet: {self.wallet_address}", file=buf)
+        print("=" * 80, file=buf)
+        print(file=buf)
 
         # Account State
         perp_account_value = 0.0
@@ -239,57 +301,57 @@ class WalletAnalyzer:
             perp_account_value = float(margin_summary.get('accountValue', 0))
             total_margin_used = float(margin_summary.get('totalMarginUsed', 0))
 
-            print("📊 PERPETUAL ACCOUNT STATE")
-            print("-" * 80)
-            print(f"Account Value:        ${perp_account_value:,.2f}")
-            print(f"Margin Used:          ${total_margin_used:,.2f}")
-            print(f"Available Balance:    ${perp_account_value - total_margin_used:,.2f}")
+            print("📊 PERPETUAL ACCOUNT STATE", file=buf)
+            print("-" * 80, file=buf)
+            print(f"Account Value:        ${perp_account_value:,.2f}", file=buf)
+            print(f"Margin Used:          ${total_margin_used:,.2f}", file=buf)
+            print(f"Available Balance:    ${perp_account_value - total_margin_used:,.2f}", file=buf)
 
             # Positions
             positions = account_state.get('assetPositions', [])
             if positions:
                 active_positions = [p for p in positions if float(p.get('position', {}).get('szi', 0)) != 0]
-                print(f"\nOpen Positions:       {len(active_positions)}")
+                print(f"\nOpen Positions:       {len(active_positions)}", file=buf)
                 for pos in active_positions:
                     coin = pos.get('position', {}).get('coin', 'UNKNOWN')
                     szi = float(pos.get('position', {}).get('szi', 0))
                     entry_px = float(pos.get('position', {}).get('entryPx', 0))
                     unrealized_pnl = float(pos.get('position', {}).get('unrealizedPnl', 0))
                     side = "LONG" if szi > 0 else "SHORT"
-                    print(f"  - {coin}: {side} {abs(szi):.4f} @ ${entry_px:,.2f} (P&L: ${unrealized_pnl:+,.2f})")
+                    print(f"  - {coin}: {side} {abs(szi):.4f} @ ${entry_px:,.2f} (P&L: ${unrealized_pnl:+,.2f})", file=buf)
             else:
-                print(f"Open Positions:       0")
+                print(f"Open Positions:       0", file=buf)
 
-            print()
+            print(file=buf)
 
         # Spot Account
         if spot_state:
             spot_balances = spot_state.get('balances', [])
             total_spot_value = 0.0
 
-            print("💵 SPOT ACCOUNT STATE")
-            print("-" * 80)
+            print("💵 SPOT ACCOUNT STATE", file=buf)
+            print("-" * 80, file=buf)
 
             if spot_balances:
                 active_balances = [b for b in spot_balances if float(b.get('total', 0)) > 0.001]
                 if active_balances:
-                    print("Balances:")
+                    print("Balances:", file=buf)
                     for balance in active_balances:
                         coin = balance.get('coin', 'UNKNOWN')
                         total = float(balance.get('total', 0))
                         hold = float(balance.get('hold', 0))
-                        print(f"  - {coin}: {total:.6f} (Hold: {hold:.6f})")
+                        print(f"  - {coin}: {total:.6f} (Hold: {hold:.6f})", file=buf)
                 else:
-                    print("No spot balances")
+                    print("No spot balances", file=buf)
             else:
-                print("No spot balances")
+                print("No spot balances", file=buf)
 
-            print()
+            print(file=buf)
 
         # Ledger Analysis (Deposits/Withdrawals/PnL/Transfers)
         if ledger:
-            print("💰 ACCOUNT ACTIVITY")
-            print("-" * 80)
+            print("💰 ACCOUNT ACTIVITY", file=buf)
+            print("-" * 80, file=buf)
 
             deposits = []
             withdrawals = []
@@ -297,7 +359,9 @@ class WalletAnalyzer:
             spot_transfers_in = []
             spot_transfers_out = []
 
-            for entry in ledger:
+            entry_times = _format_ms(np.array([entry.get('time', 0) for entry in ledger], dtype=np.float64))
+
+            for entry, entry_time in zip(ledger, entry_times):
                 delta = entry.get('delta', {})
                 ledger_type = delta.get('type', '')
 
@@ -314,7 +378,7 @@ class WalletAnalyzer:
                     is_receiver = destination == self.wallet_address.lower()
 
                     transfer_info = {
-                        'time': datetime.fromtimestamp(entry.get('time', 0) / 1000).strftime('%Y-%m-%d %H:%M:%S'),
+                        'time': entry_time,
                         'token': delta.get('token', ''),
                         'amount': float(delta.get('amount', 0)),
                         'usdcValue': float(delta.get('usdcValue', 0)),
@@ -331,25 +395,25 @@ class WalletAnalyzer:
             total_withdrawn = sum(abs(w) for w in withdrawals)
             net_deposits = total_deposited - total_withdrawn
 
-            print(f"Total Deposits:       ${total_deposited:,.2f}")
-            print(f"Total Withdrawals:    ${total_withdrawn:,.2f}")
-            print(f"Net Deposits:         ${net_deposits:+,.2f}")
+            print(f"Total Deposits:       ${total_deposited:,.2f}", file=buf)
+            print(f"Total Withdrawals:    ${total_withdrawn:,.2f}", file=buf)
+            print(f"Net Deposits:         ${net_deposits:+,.2f}", file=buf)
 
             # Show spot transfers
             if spot_transfers_in:
-                print(f"\n📥 Spot Transfers IN:  {len(spot_transfers_in)}")
+                print(f"\n📥 Spot Transfers IN:  {len(spot_transfers_in)}", file=buf)
                 for transfer in spot_transfers_in:
                     print(f"  {transfer['time']}: Received {transfer['amount']:,.2f} {transfer['token']} "
-                          f"(~${transfer['usdcValue']:,.2f})")
+                          f"(~${transfer['usdcValue']:,.2f})", file=buf)
 
             if spot_transfers_out:
-                print(f"\n📤 Spot Transfers OUT: {len(spot_transfers_out)}")
+                print(f"\n📤 Spot Transfers OUT: {len(spot_transfers_out)}", file=buf)
                 for transfer in spot_transfers_out:
                     print(f"  {transfer['time']}: Sent {transfer['amount']:,.2f} {transfer['token']} "
-                          f"(~${transfer['usdcValue']:,.2f})")
+                          f"(~${transfer['usdcValue']:,.2f})", file=buf)
 
             if liquidations:
-                print(f"\n⚠️  Liquidations:      {len(liquidations)}")
+                print(f"\n⚠️  Liquidations:      {len(liquidations)}", file=buf)
 
             # Calculate overall P&L
             if net_deposits != 0:
@@ -357,67 +421,69 @@ class WalletAnalyzer:
                 realized_pnl = current_value - net_deposits
                 realized_pnl_pct = (realized_pnl / abs(net_deposits)) * 100 if net_deposits != 0 else 0
 
-                print(f"\nRealized P&L:         ${realized_pnl:+,.2f} ({realized_pnl_pct:+.2f}%)")
+                print(f"\nRealized P&L:         ${realized_pnl:+,.2f} ({realized_pnl_pct:+.2f}%)", file=buf)
 
-            print()
+            print(file=buf)
 
         # Trading Activity
-        print("📈 TRADING ACTIVITY")
-        print("-" * 80)
-        print(f"Total Trades:         {fills_analysis.get('total_trades', 0):,}")
-        print(f"Total Volume:         ${fills_analysis.get('total_volume_usd', 0):,.2f}")
-        print(f"Total Fees Paid:      ${fills_analysis.get('total_fees_paid', 0):,.2f}")
-        print(f"Unique Assets:        {fills_analysis.get('unique_assets', 0)}")
-        print()
+        print("📈 TRADING ACTIVITY", file=buf)
+        print("-" * 80, file=buf)
+        print(f"Total Trades:         {fills_analysis.get('total_trades', 0):,}", file=buf)
+        print(f"Total Volume:         ${fills_analysis.get('total_volume_usd', 0):,.2f}", file=buf)
+        print(f"Total Fees Paid:      ${fills_analysis.get('total_fees_paid', 0):,.2f}", file=buf)
+        print(f"Unique Assets:        {fills_analysis.get('unique_assets', 0)}", file=buf)
+        print(file=buf)
 
         # Asset breakdown
         if 'assets' in fills_analysis and fills_analysis['assets']:
-            print("💰 TRADING BY ASSET")
-            print("-" * 80)
-            print(f"{'Asset':<10} {'Trades':<10} {'Buys':<8} {'Sells':<8} {'Volume (USD)':<18} {'Fees':<12}")
-            print("-" * 80)
+            print("💰 TRADING BY ASSET", file=buf)
+            print("-" * 80, file=buf)
+            print(f"{'Asset':<10} {'Trades':<10} {'Buys':<8} {'Sells':<8} {'Volume (USD)':<18} {'Fees':<12}", file=buf)
+            print("-" * 80, file=buf)
 
             for coin, stats in list(fills_analysis['assets'].items())[:15]:  # Top 15 assets
                 print(
                     f"{coin:<10} {stats['total_trades']:<10} {stats['buys']:<8} {stats['sells']:<8} "
                     f"${stats['volume_usd']:>15,.2f}  ${stats['fees_paid']:>9,.2f}"
-                )
+                , file=buf)
 
             if len(fills_analysis['assets']) > 15:
-                print(f"\n... and {len(fills_analysis['assets']) - 15} more assets")
+                print(f"\n... and {len(fills_analysis['assets']) - 15} more assets", file=buf)
 
-            print()
+            print(file=buf)
 
         # Funding Analysis
-        print("💸 FUNDING PAYMENTS")
-        print("-" * 80)
+        print("💸 FUNDING PAYMENTS", file=buf)
+        print("-" * 80, file=buf)
         net_funding = funding_analysis.get('net_funding_usd', 0)
         if net_funding > 0:
-            print(f"Net Funding Received: ${net_funding:,.2f}")
-            print("Status:               ✅ Earned from shorts (or paid longs)")
+            print(f"Net Funding Received: ${net_funding:,.2f}", file=buf)
+            print("Status:               ✅ Earned from shorts (or paid longs)", file=buf)
         elif net_funding < 0:
-            print(f"Net Funding Paid:     ${abs(net_funding):,.2f}")
-            print("Status:               ❌ Paid from longs (or received from shorts)")
+            print(f"Net Funding Paid:     ${abs(net_funding):,.2f}", file=buf)
+            print("Status:               ❌ Paid from longs (or received from shorts)", file=buf)
         else:
-            print("Net Funding:          $0.00")
-            print("Status:               No funding payments")
+            print("Net Funding:          $0.00", file=buf)
+            print("Status:               No funding payments", file=buf)
 
-        print(f"Total Payments:       {funding_analysis.get('total_payments', 0):,}")
-        print()
+        print(f"Total Payments:       {funding_analysis.get('total_payments', 0):,}", file=buf)
+        print(file=buf)
 
         # Most Traded Assets (top 5)
         if 'assets' in fills_analysis and fills_analysis['assets']:
-            print("🔥 TOP 5 MOST TRADED ASSETS")
-            print("-" * 80)
+            print("🔥 TOP 5 MOST TRADED ASSETS", file=buf)
+            print("-" * 80, file=buf)
             for i, (coin, stats) in enumerate(list(fills_analysis['assets'].items())[:5], 1):
-                print(f"{i}. {coin}")
-                print(f"   Trades: {stats['total_trades']} ({stats['buys']} buys, {stats['sells']} sells)")
-                print(f"   Volume: ${stats['volume_usd']:,.2f}")
-                print(f"   First:  {stats['first_trade']}")
-                print(f"   Last:   {stats['last_trade']}")
-                print()
+                print(f"{i}. {coin}", file=buf)
+                print(f"   Trades: {stats['total_trades']} ({stats['buys']} buys, {stats['sells']} sells)", file=buf)
+                print(f"   Volume: ${stats['volume_usd']:,.2f}", file=buf)
+                print(f"   First:  {stats['first_trade']}", file=buf)
+                print(f"   Last:   {stats['last_trade']}", file=buf)
+                print(file=buf)
 
-        print("=" * 80)
+        print("=" * 80, file=buf)
+
+        (out or sys.stdout).write(buf.getvalue())
 
 
 async def main():
@@ -433,24 +499,16 @@ async def main():
         print()
 
         async with WalletAnalyzer(wallet_address, testnet) as analyzer:
-            # Fetch data
-            print("Fetching trade history...")
-            fills = await analyzer.get_user_fills()
-
-            print("Fetching funding payments...")
-            funding = await analyzer.get_user_funding()
-
-            print("Fetching account state...")
-            account_state = await analyzer.get_account_state()
-
-            print("Fetching ledger updates...")
-            ledger = await analyzer.get_user_non_funding_ledger(limit=1000)
-
-            print("Fetching spot account state...")
-            spot_state = await analyzer.get_spot_clearinghouse_state()
-
-            print("Fetching spot trades...")
-            spot_fills = await analyzer.get_spot_user_fills()
+            # Fetch data - all independent /info calls, so run them concurrently
+            print("Fetching trade history, funding, account state, ledger, spot state and spot trades...")
+            fills, funding, account_state, ledger, spot_state, spot_fills = await asyncio.gather(
+                analyzer.get_user_fills(),
+                analyzer.get_user_funding(),
+                analyzer.get_account_state(),
+                analyzer.get_user_non_funding_ledger(limit=1000),
+                analyzer.get_spot_clearinghouse_state(),
+                analyzer.get_spot_user_fills(),
+            )
 
             print()
 
@@ -465,7 +523,7 @@ async def main():
                 funding_analysis = analyzer.analyze_funding(funding)
 
                 # Print results - pass both perp and spot fills
-                print(f"DEBUG: Perp trades: {len(fills)}, Spot trades: {len(spot_fills)}")
+                log.debug("Perp trades: %d, Spot trades: %d", len(fills), len(spot_fills))
                 analyzer.print_analysis(fills_analysis, funding_analysis, account_state, ledger, spot_state)
 
                 # Add spot trading summary
@@ -497,4 +555,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
     asyncio.run(main())
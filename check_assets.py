@@ -2,15 +2,14 @@ import asyncio
 import aiohttp
 import os
 import sys
+from dataclasses import replace
 sys.path.insert(0, '/Users/benjaminjeschke/Documents/apps/hyper-bot/hyper-bot')
 
-from src.hyperliquid.client import HyperliquidClient
+from src.hyperliquid.client import shared_client
 from src.config import config
 
 async def main():
-    client = HyperliquidClient(config.hyperliquid)
-    
-    async with client:
+    async with shared_client(replace(config.hyperliquid, info_cache_ttl=10.0)) as client:
         # Get all available markets
         response = await client._request("POST", "/info", {"type": "allMids"})
         
@@ -1,5 +1,7 @@
 """Close the test BTC position."""
+import asyncio
 import sys
+import time
 sys.path.insert(0, '/Users/benjaminjeschke/Documents/apps/hyper-bot/hyper-bot')
 
 from eth_account import Account
@@ -8,7 +10,7 @@ from hyperliquid.exchange import Exchange
 from hyperliquid.utils import constants
 from src.config import config
 
-def main():
+async def main():
     print("=" * 80)
     print("CLOSING TEST POSITION")
     print("=" * 80)
@@ -21,7 +23,7 @@ def main():
 
     # Check current positions
     print("\n1. Checking positions...")
-    user_state = info.user_state(account.address)
+    user_state = await asyncio.to_thread(info.user_state, account.address)
     positions = user_state.get("assetPositions", [])
 
     if not positions:
@@ -30,17 +32,12 @@ def main():
 
     print(f"   Found {len(positions)} position(s)")
 
-    # Close all positions
-    for pos in positions:
-        position_data = pos["position"]
+    # Get current prices once for all positions
+    all_mids = await asyncio.to_thread(info.all_mids)
+
+    async def close_one(position_data):
         coin = position_data["coin"]
         size = abs(float(position_data["szi"]))
-
-        print(f"\n2. Closing {coin} position...")
-        print(f"   Size: {size}")
-
-        # Get current price
-        all_mids = info.all_mids()
         current_price = float(all_mids[coin])
 
         # Close with market order (sell if long, buy if short)
@@ -50,33 +47,45 @@ def main():
         # Use slippage buffer - reversed logic (sell needs lower price, buy needs higher)
         close_price = round(current_price * 1.05) if is_buy else round(current_price * 0.95)
 
-        try:
-            result = exchange.order(
-                name=coin,
-                is_buy=is_buy,
-                sz=size,
-                limit_px=close_price,
-                order_type={"limit": {"tif": "Ioc"}},
-                reduce_only=True  # Important: only close, don't flip
-            )
-
-            print(f"   ✅ Close order sent: {result['status']}")
-
-            if result["status"] == "ok":
-                statuses = result["response"]["data"].get("statuses", [])
-                if statuses and "filled" in statuses[0]:
-                    filled = statuses[0]["filled"]
-                    print(f"   Closed: {filled['totalSz']} at ${filled['avgPx']}")
-
-        except Exception as e:
-            print(f"   ❌ Error closing position: {e}")
-
-    # Check final state
-    import time
-    time.sleep(2)
-
+        return await asyncio.to_thread(
+            exchange.order,
+            name=coin,
+            is_buy=is_buy,
+            sz=size,
+            limit_px=close_price,
+            order_type={"limit": {"tif": "Ioc"}},
+            reduce_only=True  # Important: only close, don't flip
+        )
+
+    # Close all positions concurrently
+    position_datas = [pos["position"] for pos in positions]
+    results = await asyncio.gather(*[close_one(p) for p in position_datas], return_exceptions=True)
+
+    for position_data, result in zip(position_datas, results):
+        print(f"\n2. Closing {position_data['coin']} position...")
+        print(f"   Size: {abs(float(position_data['szi']))}")
+
+        if isinstance(result, Exception):
+            print(f"   ❌ Error closing position: {result}")
+            continue
+
+        print(f"   ✅ Close order sent: {result['status']}")
+
+        if result["status"] == "ok":
+            statuses = result["response"]["data"].get("statuses", [])
+            if statuses and "filled" in statuses[0]:
+                filled = statuses[0]["filled"]
+                print(f"   Closed: {filled['totalSz']} at ${filled['avgPx']}")
+
+    # Check final state - poll until positions are gone (up to 2s)
     print("\n3. Final state...")
-    user_state = info.user_state(account.address)
+    deadline = time.monotonic() + 2.0
+    while True:
+        user_state = await asyncio.to_thread(info.user_state, account.address)
+        if not user_state.get("assetPositions") or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(0.1)
+
     final_balance = float(user_state["marginSummary"]["accountValue"])
     positions = user_state.get("assetPositions", [])
 
@@ -88,4 +97,4 @@ def main():
     print("=" * 80)
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
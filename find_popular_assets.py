@@ -1,25 +1,32 @@
 import asyncio
 import aiohttp
 import sys
+from dataclasses import replace
 sys.path.insert(0, '/Users/benjaminjeschke/Documents/apps/hyper-bot/hyper-bot')
 
-from src.hyperliquid.client import HyperliquidClient
+from src.hyperliquid.client import shared_client
 from src.config import config
 
+# Major cryptos we look for in the Hyperliquid universe
+POPULAR = frozenset({
+    'BTC', 'ETH', 'SOL', 'BNB', 'DOGE', 'ADA', 'AVAX', 'DOT', 'LINK', 'MATIC', 'UNI', 'ATOM', 'LTC', 'BCH', 'XLM',
+    'ALGO', 'VET', 'FIL', 'TRX', 'ETC', 'HBAR', 'APT', 'ARB', 'OP', 'SUI', 'SEI', 'INJ', 'TIA', 'PEPE', 'WIF',
+    'BONK', 'SHIB',
+})
+
 async def main():
-    client = HyperliquidClient(config.hyperliquid)
-    
-    async with client:
+    async with shared_client(replace(config.hyperliquid, info_cache_ttl=10.0)) as client:
         # Get meta info
         response = await client._request("POST", "/info", {"type": "meta"})
         
-        # Filter for major coins
+        # Filter for major coins, stopping once every one has been found
         popular = []
         for asset in response.get('universe', []):
             name = asset.get('name', '')
-            # Look for major cryptos
-            if name in ['BTC', 'ETH', 'SOL', 'BNB', 'DOGE', 'ADA', 'AVAX', 'DOT', 'LINK', 'MATIC', 'UNI', 'ATOM', 'LTC', 'BCH', 'XLM', 'ALGO', 'VET', 'FIL', 'TRX', 'ETC', 'HBAR', 'APT', 'ARB', 'OP', 'SUI', 'SEI', 'INJ', 'TIA', 'PEPE', 'WIF', 'BONK', 'SHIB']:
+            if name in POPULAR:
                 popular.append(name)
+                if len(popular) == len(POPULAR):
+                    break
         
         popular.sort()
         
@@ -1,14 +1,19 @@
 """Base Agent class for multi-agent trading system."""
 
-from abc import ABC, abstractmethod
-from typing import Dict, Any, List
-from dataclasses import dataclass
+from abc import ABC
+from typing import Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from hashlib import blake2b
+import asyncio
+import math
+import time
 import aiohttp
-import json
+import orjson
 from loguru import logger
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOpinion:
     """Opinion from a trading agent."""
     agent_name: str
@@ -19,9 +24,127 @@ class AgentOpinion:
     suggested_action: str  # "BUY", "SELL", "HOLD"
 
 
+# Fixed pieces of the agent user prompt
+_CONTEXT_TEMPLATE = "# Market Context\nAsset: {asset}\nPrice: ${price:.2f}\n\n"
+_INDICATORS_TEMPLATE = "# Technical Indicators\nRSI: {rsi}\nADX: {adx}\nMACD: {macd}\n\n"
+_HISTORY_REASONING_CHARS = 240  # Max reasoning chars per prior opinion in the prompt
+_RESPONSE_FORMAT_BLOCK = (
+    "# Your Analysis\n"
+    "Provide your expert opinion in this format:\n"
+    "{\n"
+    '  "stance": "BULLISH|BEARISH|NEUTRAL",\n'
+    '  "confidence": 0.0-1.0,\n'
+    '  "reasoning": "Your detailed reasoning",\n'
+    '  "key_points": ["Point 1", "Point 2", "Point 3"],\n'
+    '  "suggested_action": "BUY|SELL|HOLD"\n'
+    "}\n"
+)
+
+
+
+def _price_bucket(price: Any) -> Any:
+    """Bucket a price into ~0.1% log steps so tiny ticks map to the same cache key."""
+    if isinstance(price, (int, float)) and price > 0:
+        return round(math.log(price) * 1000)
+    return price
+
+
+def _round_indicator(value: Any) -> Any:
+    """Round an indicator to 3 significant digits for cache keys (non-numbers pass through)."""
+    if isinstance(value, (int, float)):
+        return f"{value:.3g}"
+    return value
+
+
+class _JsonObjectScanner:
+    """Finds the first complete top-level {...} object in text fed piece by piece."""
+
+    def __init__(self):
+        self._parts: List[str] = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> Optional[bytes]:
+        """Consume more text; return the object as UTF-8 bytes once it closes."""
+        if not self._started:
+            start = text.find("{")
+            if start == -1:
+                return None
+            text = text[start:]
+            self._started = True
+
+        for i, ch in enumerate(text):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[:i + 1])
+                    return "".join(self._parts).encode()
+
+        self._parts.append(text)
+        return None
+
+
+class _TokenBucket:
+    """Async token bucket: bursts up to capacity requests, refilled evenly over period seconds."""
+
+    def __init__(self, capacity: int, period: float):
+        self._capacity = capacity
+        self._rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request slot is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
 class BaseAgent(ABC):
     """Base class for all trading agents."""
 
+    # Event loop the shared session and limiters below belong to (see _bind_loop)
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # HTTP session shared by all agents so DeepSeek connections are pooled and kept alive
+    _session: Optional[aiohttp.ClientSession] = None
+
+    # Caps concurrent DeepSeek requests across all agents (replaces fixed sleeps between calls)
+    _request_semaphore: Optional[asyncio.Semaphore] = None
+
+    # Shared DeepSeek request budget: only waits when close to the rate limit
+    _rate_limiter: Optional[_TokenBucket] = None
+
+    # LRU cache of recent opinions keyed by a hash of (system prompt, user prompt)
+    _response_cache: "OrderedDict[str, Tuple[float, AgentOpinion]]" = OrderedDict()
+    _response_cache_size = 256
+
+    # Seconds a cached opinion stays valid (override per agent)
+    cache_ttl: float = 30.0
+
+    # Static system prompt (set by each agent)
+    SYSTEM_PROMPT: str = ""
+
     def __init__(self, name: str, role: str, api_key: str, model: str = "deepseek-chat"):
         """
         Initialize agent.
@@ -38,10 +161,55 @@ class BaseAgent(ABC):
         self.model = model
         self.base_url = "https://api.deepseek.com"
 
-    @abstractmethod
+        # Request headers built once and shared by every call (never mutated)
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+
+        # Static system message reused in every request body
+        self._system_message = {"role": "system", "content": self.SYSTEM_PROMPT}
+
+        # Cache-key hasher pre-seeded with the constant system prompt
+        self._cache_hasher = blake2b(self.SYSTEM_PROMPT.encode() + b"|", digest_size=16)
+
+    @classmethod
+    def _bind_loop(cls):
+        """Create the shared session state for the running event loop (once per loop)."""
+        loop = asyncio.get_running_loop()
+        if BaseAgent._loop is not loop:
+            # asyncio primitives and sessions cannot be used from another loop
+            BaseAgent._loop = loop
+            BaseAgent._session = None
+            BaseAgent._request_semaphore = asyncio.Semaphore(5)
+            BaseAgent._rate_limiter = _TokenBucket(capacity=30, period=60.0)
+
+    @classmethod
+    async def get_session(cls) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use in each event loop."""
+        cls._bind_loop()
+        if BaseAgent._session is None or BaseAgent._session.closed:
+            BaseAgent._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=10,
+                    ttl_dns_cache=600,  # DeepSeek's address rarely changes; skip DNS on new connections
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                )
+            )
+        return BaseAgent._session
+
+    @classmethod
+    async def close_session(cls):
+        """Close the shared HTTP session."""
+        if BaseAgent._session is not None:
+            await BaseAgent._session.close()
+            BaseAgent._session = None
+
     def get_system_prompt(self) -> str:
         """Get the system prompt for this agent."""
-        pass
+        return self.SYSTEM_PROMPT
 
     async def analyze(self,
                      context: Dict[str, Any],
@@ -56,6 +224,13 @@ class BaseAgent(ABC):
         Returns:
             Agent's opinion
         """
+        # Reuse a recent opinion for (nearly) the same market state
+        key = self._cache_key(context, discussion_history)
+        cached = self._response_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            self._response_cache.move_to_end(key)
+            return replace(cached[1], agent_name=self.name)
+
         # Build prompt with context
         prompt = self._build_prompt(context, discussion_history)
 
@@ -65,87 +240,116 @@ class BaseAgent(ABC):
         # Parse response
         opinion = self._parse_response(response)
 
+        # Only cache real answers, never API failures or unparseable replies
+        if not response.get("_error") and not response.get("_unparsed"):
+            self._response_cache[key] = (time.monotonic(), opinion)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
         return opinion
 
+    def _cache_key(self, context: Dict[str, Any], discussion_history: List[AgentOpinion] = None) -> str:
+        """Hash bucketed price, rounded indicators and the discussion exactly as the prompt shows it."""
+        parts = [str(context.get('asset', 'Unknown')), str(_price_bucket(context.get('price', 0)))]
+        if 'indicators' in context:
+            ind = context['indicators']
+            parts.extend(str(_round_indicator(ind.get(name, 'N/A'))) for name in ('rsi', 'adx', 'macd'))
+        if discussion_history:
+            for opinion in discussion_history:
+                parts.append(f"{opinion.agent_name}:{opinion.stance}:{opinion.confidence:.1f}")
+                parts.append(opinion.reasoning[:_HISTORY_REASONING_CHARS])
+                parts.extend(map(str, opinion.key_points[:3]))
+
+        hasher = self._cache_hasher.copy()
+        hasher.update("|".join(parts).encode())
+        return hasher.hexdigest()
+
     def _build_prompt(self, context: Dict[str, Any], discussion_history: List[AgentOpinion] = None) -> str:
         """Build prompt with context and discussion history."""
-        prompt = f"# Market Context\n"
-        prompt += f"Asset: {context.get('asset', 'Unknown')}\n"
-        prompt += f"Price: ${context.get('price', 0):.2f}\n\n"
+        parts = [_CONTEXT_TEMPLATE.format(asset=context.get('asset', 'Unknown'), price=context.get('price', 0))]
 
         # Add indicators if available
         if 'indicators' in context:
             ind = context['indicators']
-            prompt += "# Technical Indicators\n"
-            prompt += f"RSI: {ind.get('rsi', 'N/A')}\n"
-            prompt += f"ADX: {ind.get('adx', 'N/A')}\n"
-            prompt += f"MACD: {ind.get('macd', 'N/A')}\n\n"
+            parts.append(_INDICATORS_TEMPLATE.format(
+                rsi=ind.get('rsi', 'N/A'), adx=ind.get('adx', 'N/A'), macd=ind.get('macd', 'N/A')
+            ))
 
         # Add discussion history
         if discussion_history:
-            prompt += "# Trading Desk Discussion\n"
+            parts.append("# Trading Desk Discussion\n")
             for opinion in discussion_history:
-                prompt += f"\n**{opinion.agent_name}** ({opinion.stance}):\n"
-                prompt += f"{opinion.reasoning}\n"
-            prompt += "\n"
-
-        prompt += "# Your Analysis\n"
-        prompt += "Provide your expert opinion in this format:\n"
-        prompt += "{\n"
-        prompt += '  "stance": "BULLISH|BEARISH|NEUTRAL",\n'
-        prompt += '  "confidence": 0.0-1.0,\n'
-        prompt += '  "reasoning": "Your detailed reasoning",\n'
-        prompt += '  "key_points": ["Point 1", "Point 2", "Point 3"],\n'
-        prompt += '  "suggested_action": "BUY|SELL|HOLD"\n'
-        prompt += "}\n"
-
-        return prompt
+                # Trimmed reasoning plus key points keeps later agents' prompts short
+                parts.append(
+                    f"\n**{opinion.agent_name}** ({opinion.stance}):\n"
+                    f"{opinion.reasoning[:_HISTORY_REASONING_CHARS]}\n"
+                )
+                for point in opinion.key_points[:3]:
+                    parts.append(f"  • {point}\n")
+            parts.append("\n")
+
+        parts.append(_RESPONSE_FORMAT_BLOCK)
+
+        return "".join(parts)
 
     async def _call_deepseek(self, user_prompt: str) -> Dict[str, Any]:
         """Call DeepSeek API."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {"role": "system", "content": self.get_system_prompt()},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        "temperature": 0.1,
-                        "max_tokens": 800
-                    },
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        content = data["choices"][0]["message"]["content"]
-
-                        # Try to parse JSON from response
-                        try:
-                            # Find JSON in response
-                            start = content.find("{")
-                            end = content.rfind("}") + 1
-                            if start != -1 and end > start:
-                                json_str = content[start:end]
-                                return json.loads(json_str)
-                        except:
-                            pass
-
-                        # Fallback: return raw content
-                        return {"reasoning": content, "stance": "NEUTRAL", "confidence": 0.5}
-                    else:
-                        logger.error(f"{self.name}: API error {response.status}")
-                        return {"reasoning": "API error", "stance": "NEUTRAL", "confidence": 0.0}
+            payload = {
+                "model": self.model,
+                "messages": [
+                    self._system_message,
+                    {"role": "user", "content": user_prompt}
+                ],
+                "temperature": 0.1,
+                "max_tokens": 800,
+                "stream": True
+            }
+
+            session = await self.get_session()
+            await BaseAgent._rate_limiter.acquire()
+            async with BaseAgent._request_semaphore, session.post(
+                f"{self.base_url}/chat/completions",
+                headers=self._headers,
+                data=orjson.dumps(payload),
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                if response.status == 200:
+                    # Read SSE chunks and stop as soon as the JSON object in the reply closes
+                    scanner = _JsonObjectScanner()
+                    content_parts = []
+                    async for line in response.content:
+                        if not line.startswith(b"data:"):
+                            continue
+                        payload = line[5:].strip()
+                        if payload == b"[DONE]":
+                            break
+
+                        choices = orjson.loads(payload).get("choices")
+                        if not choices:
+                            continue
+                        delta = choices[0].get("delta", {}).get("content") or ""
+                        content_parts.append(delta)
+                        json_bytes = scanner.feed(delta)
+                        if json_bytes:
+                            response.close()
+                            try:
+                                return orjson.loads(json_bytes)
+                            except orjson.JSONDecodeError:
+                                break
+
+                    # Fallback: return raw content (truncated or invalid JSON; never cached)
+                    return {
+                        "reasoning": "".join(content_parts), "stance": "NEUTRAL", "confidence": 0.5, "_unparsed": True
+                    }
+                else:
+                    logger.error(f"{self.name}: API error {response.status}")
+                    return {"reasoning": "API error", "stance": "NEUTRAL", "confidence": 0.0, "_error": True}
 
         except Exception as e:
             logger.error(f"{self.name}: Error calling DeepSeek: {e}")
-            return {"reasoning": f"Error: {str(e)}", "stance": "NEUTRAL", "confidence": 0.0}
+            return {"reasoning": f"Error: {str(e)}", "stance": "NEUTRAL", "confidence": 0.0, "_error": True}
 
     def _parse_response(self, response: Dict[str, Any]) -> AgentOpinion:
         """Parse DeepSeek response into AgentOpinion."""
@@ -6,15 +6,7 @@ from src.agents.base_agent import BaseAgent
 class ChartAnalystAgent(BaseAgent):
     """Expert in technical analysis and chart patterns."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Chart Analyst",
-            role="Technical Indicators Expert",
-            api_key=api_key
-        )
-
-    def get_system_prompt(self) -> str:
-        return """Du bist der Chart Analyst im Trading Desk.
+    SYSTEM_PROMPT = """Du bist der Chart Analyst im Trading Desk.
 
 **Deine Expertise:**
 - Technische Indikatoren (RSI, MACD, EMAs, Bollinger Bands)
@@ -36,3 +28,10 @@ Analysiere die technischen Indikatoren und gib eine klare Einschätzung:
 - Gib eine klare Empfehlung (BULLISH/BEARISH/NEUTRAL)
 
 **Antwortformat:** JSON mit stance, confidence (0-1), reasoning, key_points, suggested_action"""
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Chart Analyst",
+            role="Technical Indicators Expert",
+            api_key=api_key
+        )
@@ -6,15 +6,9 @@ from src.agents.base_agent import BaseAgent
 class FundamentalAnalystAgent(BaseAgent):
     """Analyzes macro-economic events, news, and fundamental factors."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Fundamental Analyst",
-            role="Macro & Fundamental Expert",
-            api_key=api_key
-        )
+    cache_ttl = 120.0  # Macro view changes slowly
 
-    def get_system_prompt(self) -> str:
-        return """Du bist der Fundamental Analyst - Experte für Makroökonomie und fundamentale Faktoren.
+    SYSTEM_PROMPT = """Du bist der Fundamental Analyst - Experte für Makroökonomie und fundamentale Faktoren.
 
 **Deine Expertise:**
 - Makroökonomische Trends (Inflation, Zinsen, Geldpolitik)
@@ -74,3 +68,10 @@ Analysiere die fundamentale Lage und gib deine Einschätzung ab:
 - key_points: 2-3 wichtigste Faktoren
 - catalyst: Nächster wichtiger Event/Termin (falls relevant)
 """
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Fundamental Analyst",
+            role="Macro & Fundamental Expert",
+            api_key=api_key
+        )
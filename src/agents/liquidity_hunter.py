@@ -6,15 +6,7 @@ from src.agents.base_agent import BaseAgent
 class LiquidityHunterAgent(BaseAgent):
     """Expert in identifying liquidity grabs and stop hunts."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Liquidity Hunter",
-            role="Liquidity Grab Specialist",
-            api_key=api_key
-        )
-
-    def get_system_prompt(self) -> str:
-        return """Du bist der Liquidity Hunter im Trading Desk.
+    SYSTEM_PROMPT = """Du bist der Liquidity Hunter im Trading Desk.
 
 **Deine Expertise:**
 - MAJOR Liquidity Grabs (4h-24h Swings)
@@ -37,3 +29,10 @@ Suche nach Liquidity Grabs:
 - Entry wäre NACH dem Grab bei Reversal
 
 **Antwortformat:** JSON mit stance, confidence (0-1), reasoning, key_points, suggested_action"""
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Liquidity Hunter",
+            role="Liquidity Grab Specialist",
+            api_key=api_key
+        )
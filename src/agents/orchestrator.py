@@ -1,17 +1,51 @@
 """Orchestrator for multi-agent trading system."""
 
 import asyncio
+from bisect import bisect_right
 from typing import Dict, Any, List
 from loguru import logger
 
-from src.agents.base_agent import AgentOpinion
+from src.agents.base_agent import AgentOpinion, BaseAgent
 from src.agents.chart_analyst import ChartAnalystAgent
 from src.agents.liquidity_hunter import LiquidityHunterAgent
 from src.agents.risk_manager import RiskManagerAgent
 from src.agents.regime_expert import RegimeExpertAgent
 from src.agents.fundamental_analyst import FundamentalAnalystAgent
 from src.agents.supervisor import TradeSupervisorAgent
-from src.utils.models import TradingDecision, Decision, SetupQuality
+from src.utils.models import (
+    TradingDecision, Decision, SetupQuality,
+    MarketRegime, MarketRegimeData, ConfluenceAnalysis, IndicatorsSummary,
+    SuggestedAction, RiskAssessment,
+    OrderType, OrderSide, StopLoss, TakeProfitTarget, TrailingStop
+)
+
+# Emoji shown for each agent stance in the discussion log
+_STANCE_EMOJI = {
+    "BULLISH": "🟢",
+    "BEARISH": "🔴",
+    "NEUTRAL": "⚪",
+    "ACCEPTABLE": "✅",
+    "RISKY": "⚠️",
+    "TOO_RISKY": "❌"
+}
+
+# Regime reported for every multi-agent decision (agents don't classify it separately)
+_MULTI_AGENT_REGIME = MarketRegimeData(primary=MarketRegime.RANGING, strength=0.5, regime_aligned=True)
+
+# Supervisor action -> Decision enum
+_DECISION_MAP = {
+    "BUY": Decision.BUY,
+    "SELL": Decision.SELL,
+    "HOLD": Decision.HOLD
+}
+
+# Supervisor confidence thresholds -> setup quality
+_SQ_THRESHOLDS = (0.45, 0.60, 0.75)
+_SQ_VALUES = (SetupQuality.NO_SETUP, SetupQuality.B, SetupQuality.A, SetupQuality.A_PLUS)
+
+# Agents agreeing on one side -> confluence score (mixed / moderate / strong / very strong)
+_CONFLUENCE_THRESHOLDS = (2, 3, 4)
+_CONFLUENCE_VALUES = (3, 5, 7, 9)
 
 
 class TradingDeskOrchestrator:
@@ -41,6 +75,10 @@ class TradingDeskOrchestrator:
 
         logger.info("✅ Trading Desk ready: 6 agents initialized")
 
+    async def close(self):
+        """Release the HTTP session shared by all agents."""
+        await BaseAgent.close_session()
+
     async def run_trading_discussion(self, context: Dict[str, Any]) -> TradingDecision:
         """
         Run a complete trading desk discussion.
@@ -52,94 +90,73 @@ class TradingDeskOrchestrator:
             Final trading decision from supervisor
         """
         asset = context.get('asset', 'Unknown')
-        logger.info(f"\n{'='*80}")
-        logger.info(f"💼 TRADING DESK DISCUSSION - {asset}")
-        logger.info(f"{'='*80}\n")
+        logger.debug(f"💼 Trading desk discussion started - {asset}")
 
         discussion_history: List[AgentOpinion] = []
 
         # Phase 1: Initial Analysis (PARALLEL - runs 4x faster!)
-        logger.info("📊 Phase 1: Initial Market Analysis")
-        logger.info("-" * 80)
-        logger.info("⚡ Running 4 agents in PARALLEL...")
-
-        # Run all 4 analysts in parallel for maximum speed
-        chart_task = self.chart_analyst.analyze(context, discussion_history)
-        liq_task = self.liquidity_hunter.analyze(context, discussion_history)
-        regime_task = self.regime_expert.analyze(context, discussion_history)
-        fundamental_task = self.fundamental_analyst.analyze(context, discussion_history)
+        # Run all 4 analysts in parallel for maximum speed - they don't depend on each other
+        chart_task = self.chart_analyst.analyze(context, [])
+        liq_task = self.liquidity_hunter.analyze(context, [])
+        regime_task = self.regime_expert.analyze(context, [])
+        fundamental_task = self.fundamental_analyst.analyze(context, [])
 
         # Wait for all to complete
         chart_opinion, liq_opinion, regime_opinion, fundamental_opinion = await asyncio.gather(
             chart_task, liq_task, regime_task, fundamental_task
         )
-
-        # Add to discussion history and log results
-        logger.info(f"\n🔍 {self.chart_analyst.name}:")
-        discussion_history.append(chart_opinion)
-        self._log_opinion(chart_opinion)
-
-        logger.info(f"\n🎯 {self.liquidity_hunter.name}:")
-        discussion_history.append(liq_opinion)
-        self._log_opinion(liq_opinion)
-
-        logger.info(f"\n🌊 {self.regime_expert.name}:")
-        discussion_history.append(regime_opinion)
-        self._log_opinion(regime_opinion)
-
-        logger.info(f"\n📰 {self.fundamental_analyst.name}:")
-        discussion_history.append(fundamental_opinion)
-        self._log_opinion(fundamental_opinion)
+        discussion_history.extend((chart_opinion, liq_opinion, regime_opinion, fundamental_opinion))
 
         # Phase 2: Risk Assessment
-        logger.info(f"\n{'='*80}")
-        logger.info("🛡️ Phase 2: Risk Management Review")
-        logger.info("-" * 80)
-
-        logger.info(f"⚖️ {self.risk_manager.name} assessing...")
+        logger.debug(f"⚖️ {self.risk_manager.name} assessing...")
         risk_opinion = await self.risk_manager.analyze(context, discussion_history)
         discussion_history.append(risk_opinion)
-        self._log_opinion(risk_opinion)
-        await asyncio.sleep(2)  # Rate limit protection
 
         # Phase 3: Supervisor Decision
-        logger.info(f"\n{'='*80}")
-        logger.info("👔 Phase 3: Supervisor Final Decision")
-        logger.info("-" * 80)
-
-        logger.info(f"⚡ {self.supervisor.name} deciding...")
+        logger.debug(f"⚡ {self.supervisor.name} deciding...")
         final_opinion = await self.supervisor.analyze(context, discussion_history)
-        self._log_opinion(final_opinion)
 
         # Build TradingDecision from consensus
         decision = self._build_trading_decision(final_opinion, discussion_history, context)
 
-        logger.info(f"\n{'='*80}")
-        logger.info(f"🏁 FINAL DECISION: {decision.decision}")
-        logger.info(f"   Confidence: {decision.confidence:.0%}")
-        logger.info(f"   Setup Quality: {decision.setup_quality}")
-        logger.info(f"{'='*80}\n")
+        # Whole discussion as one log record instead of ~40 separate sink writes
+        lines = [
+            "=" * 80,
+            f"💼 TRADING DESK DISCUSSION - {asset}",
+            "=" * 80,
+            "📊 Phase 1: Initial Market Analysis (4 agents in parallel)",
+            "-" * 80,
+        ]
+        for emoji, opinion in (("🔍", chart_opinion), ("🎯", liq_opinion),
+                               ("🌊", regime_opinion), ("📰", fundamental_opinion)):
+            lines.append(f"\n{emoji} {opinion.agent_name}:")
+            self._format_opinion(opinion, lines)
+
+        lines += ["=" * 80, "🛡️ Phase 2: Risk Management Review", "-" * 80, f"⚖️ {risk_opinion.agent_name}:"]
+        self._format_opinion(risk_opinion, lines)
+
+        lines += ["=" * 80, "👔 Phase 3: Supervisor Final Decision", "-" * 80, f"⚡ {final_opinion.agent_name}:"]
+        self._format_opinion(final_opinion, lines)
+
+        lines += [
+            "=" * 80,
+            f"🏁 FINAL DECISION: {decision.decision}",
+            f"   Confidence: {decision.confidence:.0%}",
+            f"   Setup Quality: {decision.setup_quality}",
+            "=" * 80,
+        ]
+        logger.bind(asset=asset, decision=decision.decision.value).info("\n" + "\n".join(lines) + "\n")
 
         return decision
 
-    def _log_opinion(self, opinion: AgentOpinion):
-        """Log agent opinion in a nice format."""
-        stance_emoji = {
-            "BULLISH": "🟢",
-            "BEARISH": "🔴",
-            "NEUTRAL": "⚪",
-            "ACCEPTABLE": "✅",
-            "RISKY": "⚠️",
-            "TOO_RISKY": "❌"
-        }
-        emoji = stance_emoji.get(opinion.stance, "❓")
-
-        logger.info(f"{emoji} {opinion.stance} (Confidence: {opinion.confidence:.0%})")
-        logger.info(f"   {opinion.reasoning[:150]}...")
+    def _format_opinion(self, opinion: AgentOpinion, lines: List[str]):
+        """Append agent opinion lines in a nice format."""
+        emoji = _STANCE_EMOJI.get(opinion.stance, "❓")
 
-        if opinion.key_points:
-            for point in opinion.key_points[:2]:
-                logger.info(f"   • {point}")
+        lines.append(f"{emoji} {opinion.stance} (Confidence: {opinion.confidence:.0%})")
+        lines.append(f"   {opinion.reasoning[:150]}...")
+        for point in opinion.key_points[:2]:
+            lines.append(f"   • {point}")
 
     def _build_trading_decision(self,
                                 final_opinion: AgentOpinion,
@@ -148,26 +165,28 @@ class TradingDeskOrchestrator:
         """Build TradingDecision from agent consensus."""
 
         # Map supervisor decision to Decision enum
-        decision_map = {
-            "BUY": Decision.BUY,
-            "SELL": Decision.SELL,
-            "HOLD": Decision.HOLD
-        }
-        final_decision = decision_map.get(final_opinion.suggested_action, Decision.HOLD)
+        final_decision = _DECISION_MAP.get(final_opinion.suggested_action, Decision.HOLD)
 
         # Determine setup quality from confidence
-        if final_opinion.confidence >= 0.75:
-            setup_quality = SetupQuality.A_PLUS
-        elif final_opinion.confidence >= 0.60:
-            setup_quality = SetupQuality.A
-        elif final_opinion.confidence >= 0.45:
-            setup_quality = SetupQuality.B
-        else:
-            setup_quality = SetupQuality.NO_SETUP
-
-        # Count bullish/bearish agents
-        bullish_count = sum(1 for op in discussion if op.stance == "BULLISH")
-        bearish_count = sum(1 for op in discussion if op.stance == "BEARISH")
+        setup_quality = _SQ_VALUES[bisect_right(_SQ_THRESHOLDS, final_opinion.confidence)]
+
+        # Single pass: count bullish/bearish agents, collect key factors and vote lines
+        key_factors = {
+            "bullish": [],
+            "bearish": [],
+            "neutral": []
+        }
+        bullish_count = bearish_count = 0
+        vote_lines = []
+
+        for opinion in discussion:
+            if opinion.stance == "BULLISH":
+                bullish_count += 1
+                key_factors["bullish"].extend(opinion.key_points[:1])
+            elif opinion.stance == "BEARISH":
+                bearish_count += 1
+                key_factors["bearish"].extend(opinion.key_points[:1])
+            vote_lines.append(f"- {opinion.agent_name}: {opinion.stance} ({opinion.confidence:.0%})\n")
 
         # PROGRAMMATIC OVERRIDE: If all 5 agents unanimously agree, force the decision
         # (Don't rely solely on Supervisor AI following instructions)
@@ -185,46 +204,18 @@ class TradingDeskOrchestrator:
             logger.warning("⚠️  OVERRIDE: Strong majority (4/5) BULLISH but Supervisor said HOLD → Forcing BUY")
             final_decision = Decision.BUY
 
-        # Build consensus summary
-        key_factors = {
-            "bullish": [],
-            "bearish": [],
-            "neutral": []
-        }
-
-        for opinion in discussion:
-            if opinion.stance == "BULLISH":
-                key_factors["bullish"].extend(opinion.key_points[:1])
-            elif opinion.stance == "BEARISH":
-                key_factors["bearish"].extend(opinion.key_points[:1])
-
         # Calculate confluence score based on agent agreement
-        if bullish_count >= 4 or bearish_count >= 4:
-            confluence_score = 9  # Very strong agreement (4-5 agents)
-        elif bullish_count >= 3 or bearish_count >= 3:
-            confluence_score = 7  # Strong agreement (3 agents)
-        elif bullish_count >= 2 or bearish_count >= 2:
-            confluence_score = 5  # Moderate agreement (2 agents)
-        else:
-            confluence_score = 3  # Mixed signals
+        confluence_score = _CONFLUENCE_VALUES[bisect_right(_CONFLUENCE_THRESHOLDS, max(bullish_count, bearish_count))]
 
         # Build reasoning summary
         reasoning = f"**Multi-Agent Consensus:** {final_opinion.reasoning}\n\n"
         reasoning += f"**Agent Votes:** {bullish_count} Bullish, {bearish_count} Bearish\n"
-        for opinion in discussion:
-            reasoning += f"- {opinion.agent_name}: {opinion.stance} ({opinion.confidence:.0%})\n"
-
-        # Create TradingDecision
-        from src.utils.models import (
-            MarketRegime, MarketRegimeData, ConfluenceAnalysis, IndicatorsSummary,
-            SuggestedAction, RiskAssessment,
-            OrderType, OrderSide, StopLoss, TakeProfitTarget, TrailingStop
-        )
+        reasoning += "".join(vote_lines)
 
         # Extract current price from context
         price = context.get('price', 0.0)
 
-        # Build suggested action if not HOLD
+        # Build suggested action if not HOLD (HOLD skips the order/SL/TP tree entirely)
         suggested_action = None
         if final_decision != Decision.HOLD:
             side = OrderSide.BUY if final_decision == Decision.BUY else OrderSide.SELL
@@ -259,7 +250,7 @@ class TradingDeskOrchestrator:
             setup_quality=setup_quality,
             confidence=final_opinion.confidence,
             confluence_score=confluence_score,
-            market_regime=MarketRegimeData(primary=MarketRegime.RANGING, strength=0.5, regime_aligned=True),
+            market_regime=_MULTI_AGENT_REGIME,
             confluence_analysis=ConfluenceAnalysis(
                 trend_score=1 if bullish_count > bearish_count else -1,
                 trend_details="Multi-agent analysis",
@@ -297,7 +288,7 @@ class TradingDeskOrchestrator:
             monitoring_points=[],
             meta={
                 "multi_agent": True,
-                "agent_opinions": [str(op) for op in discussion],
+                "agent_opinions": discussion,
                 "consensus_level": confluence_score
             }
         )
@@ -6,15 +6,7 @@ from src.agents.base_agent import BaseAgent
 class RegimeExpertAgent(BaseAgent):
     """Expert in identifying market regimes and conditions."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Market Regime Expert",
-            role="Market Conditions Specialist",
-            api_key=api_key
-        )
-
-    def get_system_prompt(self) -> str:
-        return """Du bist der Market Regime Expert im Trading Desk.
+    SYSTEM_PROMPT = """Du bist der Market Regime Expert im Trading Desk.
 
 **Deine Expertise:**
 - Trending vs Ranging Markets
@@ -36,3 +28,10 @@ Bestimme das aktuelle Market Regime:
 - Low Volume = abwarten
 
 **Antwortformat:** JSON mit regime (TRENDING_BULL/TRENDING_BEAR/RANGING/etc), confidence, reasoning"""
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Market Regime Expert",
+            role="Market Conditions Specialist",
+            api_key=api_key
+        )
@@ -6,15 +6,9 @@ from src.agents.base_agent import BaseAgent
 class RiskManagerAgent(BaseAgent):
     """Expert in risk management and position sizing."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Risk Manager",
-            role="Risk Management Expert",
-            api_key=api_key
-        )
+    cache_ttl = 15.0  # Risk view must track the latest price closely
 
-    def get_system_prompt(self) -> str:
-        return """Du bist der Risk Manager im Trading Desk.
+    SYSTEM_PROMPT = """Du bist der Risk Manager im Trading Desk.
 
 **Deine Expertise:**
 - Risk/Reward Ratio Bewertung
@@ -38,3 +32,10 @@ Bewerte das Risiko eines vorgeschlagenen Trades:
 - Bei hoher Volatilität = kleinere Position
 
 **Antwortformat:** JSON mit stance (ACCEPTABLE/RISKY/TOO_RISKY), confidence, reasoning, key_points"""
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Risk Manager",
+            role="Risk Management Expert",
+            api_key=api_key
+        )
@@ -6,15 +6,7 @@ from src.agents.base_agent import BaseAgent
 class TradeSupervisorAgent(BaseAgent):
     """Supervises all agents and makes final trading decision."""
 
-    def __init__(self, api_key: str):
-        super().__init__(
-            name="Trade Supervisor",
-            role="Trading Desk Supervisor",
-            api_key=api_key
-        )
-
-    def get_system_prompt(self) -> str:
-        return """Du bist der Trade Supervisor - der Chef des Trading Desks.
+    SYSTEM_PROMPT = """Du bist der Trade Supervisor - der Chef des Trading Desks.
 
 **Deine Aufgabe:**
 Du hast die Meinungen aller Experten gehört. Jetzt triffst DU die finale Entscheidung und gibst BUY, SELL oder HOLD.
@@ -57,3 +49,10 @@ Du hast die Meinungen aller Experten gehört. Jetzt triffst DU die finale Entsch
 - confidence: 0-100
 - reasoning: kurze Begründung
 - consensus_summary: Agent-Zählung"""
+
+    def __init__(self, api_key: str):
+        super().__init__(
+            name="Trade Supervisor",
+            role="Trading Desk Supervisor",
+            api_key=api_key
+        )
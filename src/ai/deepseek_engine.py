@@ -1,9 +1,13 @@
 """DeepSeek AI engine for trading decisions."""
 
-import json
+import asyncio
+import queue
+import threading
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
-from openai import AsyncOpenAI
+import orjson
+from openai import AsyncOpenAI, Timeout
 from loguru import logger
 
 from src.config import DeepSeekConfig
@@ -22,9 +26,169 @@ from src.utils.models import (
     DerivativesData,
     Portfolio,
     MarketRegime,
+    OrderType,
+    OrderSide,
+    StopLoss,
+    TakeProfitTarget,
+    TrailingStop,
 )
 
 
+# Market data section of the user prompt, filled via format_map in generate_prompt
+_PROMPT_TEMPLATE = """
+# Current Market Data for {asset}
+
+## Multi-Timeframe Price Data
+- Current Price: ${current_price:.2f}
+- Mark Price: ${mark_price:.2f}
+- Index Price: ${index_price:.2f}
+
+**1m Timeframe:**
+- Price Change: {pc_1m:.2f}% | Volume: ${vol_1m:,.0f}
+
+**5m Timeframe:**
+- Price Change: {pc_5m:.2f}% | Volume: ${vol_5m:,.0f} | Volatility: {volat_5m:.2f}%
+
+**15m Timeframe:**
+- Price Change: {pc_15m:.2f}% | Volume: ${vol_15m:,.0f}
+
+**1h Timeframe:**
+- Price Change: {pc_1h:.2f}% | Volume: ${vol_1h:,.0f}
+- High: ${high_1h:.2f} | Low: ${low_1h:.2f}
+
+**4h Timeframe:**
+- Price Change: {pc_4h:.2f}% | High: ${high_4h:.2f} | Low: ${low_4h:.2f}
+
+**24h Timeframe:**
+- Price Change: {pc_24h:.2f}% | Volume: ${vol_24h:,.0f}
+- High: ${high_24h:.2f} | Low: ${low_24h:.2f}
+
+## Technical Indicators
+
+**Momentum & Oscillators:**
+- RSI(14): 5m: {rsi_5m:.1f} | 1h: {rsi_1h:.1f} | 4h: {rsi_4h:.1f}
+- MACD 1h: Value: {macd_value:.2f} | Signal: {macd_signal:.2f} | Histogram: {macd_histogram:.2f}
+
+**Trend Indicators:**
+- EMA 20/50/200: {ema_20:.2f} / {ema_50:.2f} / {ema_200:.2f}
+- ADX(14): {adx:.1f} | +DI/-DI: {plus_di:.1f} / {minus_di:.1f}
+- Supertrend: {supertrend:.2f} (Signal: {supertrend_signal})
+
+**Volatility:**
+- Bollinger Bands: Upper: {bb_upper:.2f} | Middle: {bb_middle:.2f} | Lower: {bb_lower:.2f}
+- %B Position: {bb_percent_b:.2f}
+- ATR(14): {atr:.2f} ({atr_percent:.2f}% of price)
+
+**Volume Analysis:**
+- VWAP Daily: {vwap_daily:.2f}
+- CVD: {cvd:.0f} (Trend: {cvd_trend})
+- OBV: {obv:.0f} (Trend: {obv_trend})
+- Volume Ratio: {volume_ratio:.2f}x
+
+## 📊 DETAILED CHART HISTORY (Recent Price Action)
+**Analysiere diese Daten wie ein Chart - identifiziere Patterns, Support/Resistance, Trends!**
+
+### Key Price Levels (abgeleitet aus Historie):
+- **Recent High**: ${high_24h:.2f}
+- **Recent Low**: ${low_24h:.2f}
+- **Current vs High**: {vs_high:.1f}%
+- **Current vs Low**: {vs_low:.1f}%
+
+## Orderbook & Microstructure
+- Top 10 Bids: {bid_levels} levels (Total: ${bid_liquidity:,.0f})
+- Top 10 Asks: {ask_levels} levels (Total: ${ask_liquidity:,.0f})
+- Bid-Ask Spread: {spread_bps:.1f} bps (${spread_usd:.2f})
+- Orderbook Imbalance: {imbalance:+.1f}% {imbalance_label}
+
+## Derivatives Data
+- Funding Rate: {funding_rate:.4f}% per 8h (Annual: {funding_rate_annual:.2f}%)
+- Funding Trend: {funding_trend}
+- Next Funding: in {time_to_funding} minutes
+- Open Interest: ${open_interest:,.0f} ({oi_change_24h:+.1f}% change 24h)
+- OI Trend: {oi_trend}
+- Long/Short Ratio: {long_short_ratio:.2f} ({ratio_interpretation})
+
+## Portfolio Status
+- Total Account Value: ${total_value:,.2f} USDC
+- Available Balance: ${available_balance:,.2f} USDC
+- Used Margin: ${used_margin:,.2f} USDC ({margin_usage_percent:.1f}%)
+- Current Exposure: {exposure_percent:.1f}% of total capital
+- Current Positions: {position_count}
+- Unrealized P&L: ${unrealized_pnl:,.2f}
+- Realized P&L (24h): ${realized_pnl_24h:,.2f}
+
+"""
+
+# Asset-invariant chart-reading checklist, appended to the system prompt so every
+# request shares one byte-identical prefix (DeepSeek caches repeated prefixes automatically)
+_CHART_ANALYSIS_GUIDE = """
+
+## Chart-Analyse (für die Kursdaten im User-Prompt)
+
+_Identifiziere:_
+- Higher Highs / Lower Lows? (Trend)
+- Support und Resistance Zones
+- Breakouts oder Rejections
+- Volume Profile (wo war meiste Aktivität?)
+- Swing Points für Stop-Loss Platzierung
+
+### Pattern Recognition (denke laut):
+- "Sehe ich Double Top/Bottom?"
+- "Ist das ein Triangle/Wedge Pattern?"
+- "Bull/Bear Flag im Gange?"
+- "Wo sind die letzten Swing Highs/Lows für Stop-Loss?"
+"""
+
+# Fixed analysis request appended after the positions list (concise, no CoT)
+_PROMPT_FOOTER = """
+Follow the system prompt. Output JSON only, strictly matching the schema. No chain-of-thought.
+"""
+
+# Field defaults for sections parsed straight from the decision JSON (mutable defaults stay inline)
+_CONFLUENCE_DEFAULTS = {
+    "trend_score": 0,
+    "trend_details": "",
+    "momentum_score": 0,
+    "momentum_details": "",
+    "volume_score": 0,
+    "volume_details": "",
+    "microstructure_score": 0,
+    "microstructure_details": "",
+    "total_confluence": 0,
+}
+
+_RISK_DEFAULTS = {
+    "overall_risk": "MEDIUM",
+    "edge_quality": 0.5,
+    "risk_reward_ratio": 0.0,
+    "expected_value": 0.0,
+    "position_size_modifier": 1.0,
+    "slippage_estimate": 0.0,
+    "liquidity_check": "PASS",
+    "funding_impact": 0.0,
+    "margin_safety": 100.0,
+    "liquidation_distance_pct": 0.0,
+}
+
+
+# Directory for per-decision reasoning logs and the rolling HOLD summary
+_LOG_DIR = Path("logs/ai_thinking")
+
+# Legacy-shape take-profit target defaults
+_TP_DEFAULTS = {
+    "target": 1,
+    "price": 0.0,
+    "percentage_to_close": 100,
+    "reasoning": "",
+    "rr_ratio": 1.0,
+}
+
+
+def _pretty_json(obj: Any) -> str:
+    """Indented JSON for the reasoning log."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
 class DeepSeekEngine:
     """
     DeepSeek AI engine for trading analysis and decisions.
@@ -37,9 +201,41 @@ class DeepSeekEngine:
         self.config = config
         self.client = AsyncOpenAI(
             api_key=config.api_key,
-            base_url=config.base_url
+            base_url=config.base_url,
+            max_retries=3,  # SDK retries 429/5xx with exponential backoff
+            timeout=Timeout(60.0, connect=5.0)  # Fail fast instead of the SDK's 10 min read timeout
         )
 
+        # prompt.md is read once; restart the bot to pick up edits
+        self._system_prompt = self._load_system_prompt() + _CHART_ANALYSIS_GUIDE
+        self._system_message = {"role": "system", "content": self._system_prompt}
+
+        # Reasoning logs are written to disk by a single background thread
+        _LOG_DIR.mkdir(parents=True, exist_ok=True)
+        self._log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._log_writer = threading.Thread(target=self._log_worker, name="reasoning-log-writer", daemon=True)
+        self._log_writer.start()
+
+    async def aclose(self) -> None:
+        """Flush pending reasoning logs and close the pooled HTTP connections of the API client."""
+        self._log_queue.put(None)
+        await asyncio.to_thread(self._log_writer.join, 5.0)
+        await self.client.close()
+
+    def _log_worker(self) -> None:
+        """Write queued (path, content, mode) reasoning logs until a None sentinel arrives."""
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                return
+            log_file, log_content, mode = item
+            try:
+                with open(log_file, mode, encoding="utf-8") as f:
+                    f.write(log_content)
+                logger.debug(f"Saved AI reasoning log to: {log_file}")
+            except OSError as e:
+                logger.error(f"Failed to save AI reasoning log: {e}")
+
     def _load_system_prompt(self) -> str:
         """Load the system prompt from prompt.md."""
         try:
@@ -85,129 +281,109 @@ class DeepSeekEngine:
         data_4h = market_data.data_4h
         data_24h = market_data.data_24h
 
+        price = market_data.current_price
+
+        # 24h range used for the key price levels (falls back to the current price)
+        recent_high = data_24h.high if data_24h and data_24h.high > 0 else price
+        recent_low = data_24h.low if data_24h and data_24h.low > 0 else price
+
         # Get indicators for different timeframes
         ind_5m = indicators.get("5m", TechnicalIndicators())
         ind_1h = indicators.get("1h", TechnicalIndicators())
         ind_4h = indicators.get("4h", TechnicalIndicators())
 
         # Build the data prompt
-        data_prompt = f"""
-# Current Market Data for {asset}
-
-## Multi-Timeframe Price Data
-- Current Price: ${market_data.current_price:.2f}
-- Mark Price: ${market_data.mark_price:.2f}
-- Index Price: ${market_data.index_price:.2f}
-
-**1m Timeframe:**
-- Price Change: {data_1m.price_change if data_1m else 0:.2f}% | Volume: ${data_1m.volume if data_1m else 0:,.0f}
-
-**5m Timeframe:**
-- Price Change: {data_5m.price_change if data_5m else 0:.2f}% | Volume: ${data_5m.volume if data_5m else 0:,.0f} | Volatility: {data_5m.volatility if data_5m and data_5m.volatility else 0:.2f}%
-
-**15m Timeframe:**
-- Price Change: {data_15m.price_change if data_15m else 0:.2f}% | Volume: ${data_15m.volume if data_15m else 0:,.0f}
-
-**1h Timeframe:**
-- Price Change: {data_1h.price_change if data_1h else 0:.2f}% | Volume: ${data_1h.volume if data_1h else 0:,.0f}
-- High: ${data_1h.high if data_1h else 0:.2f} | Low: ${data_1h.low if data_1h else 0:.2f}
-
-**4h Timeframe:**
-- Price Change: {data_4h.price_change if data_4h else 0:.2f}% | High: ${data_4h.high if data_4h else 0:.2f} | Low: ${data_4h.low if data_4h else 0:.2f}
-
-**24h Timeframe:**
-- Price Change: {data_24h.price_change if data_24h else 0:.2f}% | Volume: ${data_24h.volume if data_24h else 0:,.0f}
-- High: ${data_24h.high if data_24h else 0:.2f} | Low: ${data_24h.low if data_24h else 0:.2f}
-
-## Technical Indicators
-
-**Momentum & Oscillators:**
-- RSI(14): 5m: {ind_5m.rsi_5m or 50:.1f} | 1h: {ind_1h.rsi_1h or 50:.1f} | 4h: {ind_4h.rsi_4h or 50:.1f}
-- MACD 1h: Value: {ind_1h.macd.value if ind_1h.macd else 0:.2f} | Signal: {ind_1h.macd.signal if ind_1h.macd else 0:.2f} | Histogram: {ind_1h.macd.histogram if ind_1h.macd else 0:.2f}
-
-**Trend Indicators:**
-- EMA 20/50/200: {ind_1h.ema_20 or 0:.2f} / {ind_1h.ema_50 or 0:.2f} / {ind_1h.ema_200 or 0:.2f}
-- ADX(14): {ind_1h.adx or 0:.1f} | +DI/-DI: {ind_1h.plus_di or 0:.1f} / {ind_1h.minus_di or 0:.1f}
-- Supertrend: {ind_1h.supertrend or 0:.2f} (Signal: {ind_1h.supertrend_signal or "neutral"})
-
-**Volatility:**
-- Bollinger Bands: Upper: {ind_1h.bollinger_bands.upper if ind_1h.bollinger_bands else 0:.2f} | Middle: {ind_1h.bollinger_bands.middle if ind_1h.bollinger_bands else 0:.2f} | Lower: {ind_1h.bollinger_bands.lower if ind_1h.bollinger_bands else 0:.2f}
-- %B Position: {ind_1h.bollinger_bands.percent_b if ind_1h.bollinger_bands else 0:.2f}
-- ATR(14): {ind_1h.atr or 0:.2f} ({ind_1h.atr_percent or 0:.2f}% of price)
-
-**Volume Analysis:**
-- VWAP Daily: {ind_1h.vwap_daily or 0:.2f}
-- CVD: {ind_1h.cvd or 0:.0f} (Trend: {ind_1h.cvd_trend or "neutral"})
-- OBV: {ind_1h.obv or 0:.0f} (Trend: {ind_1h.obv_trend or "neutral"})
-- Volume Ratio: {ind_1h.volume_ratio or 1:.2f}x
-
-## 📊 DETAILED CHART HISTORY (Recent Price Action)
-**Analysiere diese Daten wie ein Chart - identifiziere Patterns, Support/Resistance, Trends!**
-
-### Last 24 Hours Price Movement (1h Candles):
-```
-Time       | Open     | High     | Low      | Close    | Volume   | Change
------------|----------|----------|----------|----------|----------|--------
-```
-
-_Identifiziere:_
-- Higher Highs / Lower Lows? (Trend)
-- Support und Resistance Zones
-- Breakouts oder Rejections
-- Volume Profile (wo war meiste Aktivität?)
-- Swing Points für Stop-Loss Platzierung
-
-### Key Price Levels (abgeleitet aus Historie):
-- **Recent High**: ${data_24h.high if data_24h else 0:.2f}
-- **Recent Low**: ${data_24h.low if data_24h else 0:.2f}
-- **Current vs High**: {((market_data.current_price / (data_24h.high if data_24h and data_24h.high > 0 else market_data.current_price)) - 1) * 100:.1f}%
-- **Current vs Low**: {((market_data.current_price / (data_24h.low if data_24h and data_24h.low > 0 else market_data.current_price)) - 1) * 100:.1f}%
-
-### Pattern Recognition (denke laut):
-- "Sehe ich Double Top/Bottom?"
-- "Ist das ein Triangle/Wedge Pattern?"
-- "Bull/Bear Flag im Gange?"
-- "Wo sind die letzten Swing Highs/Lows für Stop-Loss?"
-
-## Orderbook & Microstructure
-- Top 10 Bids: {len(orderbook.bids)} levels (Total: ${orderbook.bid_liquidity:,.0f})
-- Top 10 Asks: {len(orderbook.asks)} levels (Total: ${orderbook.ask_liquidity:,.0f})
-- Bid-Ask Spread: {orderbook.spread_bps:.1f} bps (${orderbook.spread_usd:.2f})
-- Orderbook Imbalance: {orderbook.imbalance:+.1f}% {"(bid pressure)" if orderbook.imbalance > 0 else "(ask pressure)" if orderbook.imbalance < 0 else "(balanced)"}
-
-## Derivatives Data
-- Funding Rate: {derivatives.funding_rate:.4f}% per 8h (Annual: {derivatives.funding_rate_annual:.2f}%)
-- Funding Trend: {derivatives.funding_trend}
-- Next Funding: in {derivatives.time_to_funding} minutes
-- Open Interest: ${derivatives.open_interest:,.0f} ({derivatives.oi_change_24h:+.1f}% change 24h)
-- OI Trend: {derivatives.oi_trend}
-- Long/Short Ratio: {derivatives.long_short_ratio:.2f} ({derivatives.ratio_interpretation})
-
-## Portfolio Status
-- Total Account Value: ${portfolio.total_value:,.2f} USDC
-- Available Balance: ${portfolio.available_balance:,.2f} USDC
-- Used Margin: ${portfolio.used_margin:,.2f} USDC ({portfolio.margin_usage_percent:.1f}%)
-- Current Exposure: {portfolio.exposure_percent:.1f}% of total capital
-- Current Positions: {len(portfolio.positions)}
-- Unrealized P&L: ${portfolio.unrealized_pnl:,.2f}
-- Realized P&L (24h): ${portfolio.realized_pnl_24h:,.2f}
-
-"""
+        parts = [_PROMPT_TEMPLATE.format_map({
+            "asset": asset,
+            "current_price": price,
+            "mark_price": market_data.mark_price,
+            "index_price": market_data.index_price,
+            "pc_1m": data_1m.price_change if data_1m else 0,
+            "vol_1m": data_1m.volume if data_1m else 0,
+            "pc_5m": data_5m.price_change if data_5m else 0,
+            "vol_5m": data_5m.volume if data_5m else 0,
+            "volat_5m": data_5m.volatility if data_5m and data_5m.volatility else 0,
+            "pc_15m": data_15m.price_change if data_15m else 0,
+            "vol_15m": data_15m.volume if data_15m else 0,
+            "pc_1h": data_1h.price_change if data_1h else 0,
+            "vol_1h": data_1h.volume if data_1h else 0,
+            "high_1h": data_1h.high if data_1h else 0,
+            "low_1h": data_1h.low if data_1h else 0,
+            "pc_4h": data_4h.price_change if data_4h else 0,
+            "high_4h": data_4h.high if data_4h else 0,
+            "low_4h": data_4h.low if data_4h else 0,
+            "pc_24h": data_24h.price_change if data_24h else 0,
+            "vol_24h": data_24h.volume if data_24h else 0,
+            "high_24h": data_24h.high if data_24h else 0,
+            "low_24h": data_24h.low if data_24h else 0,
+            "rsi_5m": ind_5m.rsi_5m or 50,
+            "rsi_1h": ind_1h.rsi_1h or 50,
+            "rsi_4h": ind_4h.rsi_4h or 50,
+            "macd_value": ind_1h.macd.value if ind_1h.macd else 0,
+            "macd_signal": ind_1h.macd.signal if ind_1h.macd else 0,
+            "macd_histogram": ind_1h.macd.histogram if ind_1h.macd else 0,
+            "ema_20": ind_1h.ema_20 or 0,
+            "ema_50": ind_1h.ema_50 or 0,
+            "ema_200": ind_1h.ema_200 or 0,
+            "adx": ind_1h.adx or 0,
+            "plus_di": ind_1h.plus_di or 0,
+            "minus_di": ind_1h.minus_di or 0,
+            "supertrend": ind_1h.supertrend or 0,
+            "supertrend_signal": ind_1h.supertrend_signal or "neutral",
+            "bb_upper": ind_1h.bollinger_bands.upper if ind_1h.bollinger_bands else 0,
+            "bb_middle": ind_1h.bollinger_bands.middle if ind_1h.bollinger_bands else 0,
+            "bb_lower": ind_1h.bollinger_bands.lower if ind_1h.bollinger_bands else 0,
+            "bb_percent_b": ind_1h.bollinger_bands.percent_b if ind_1h.bollinger_bands else 0,
+            "atr": ind_1h.atr or 0,
+            "atr_percent": ind_1h.atr_percent or 0,
+            "vwap_daily": ind_1h.vwap_daily or 0,
+            "cvd": ind_1h.cvd or 0,
+            "cvd_trend": ind_1h.cvd_trend or "neutral",
+            "obv": ind_1h.obv or 0,
+            "obv_trend": ind_1h.obv_trend or "neutral",
+            "volume_ratio": ind_1h.volume_ratio or 1,
+            "vs_high": (price / recent_high - 1) * 100,
+            "vs_low": (price / recent_low - 1) * 100,
+            "bid_levels": len(orderbook.bids),
+            "bid_liquidity": orderbook.bid_liquidity,
+            "ask_levels": len(orderbook.asks),
+            "ask_liquidity": orderbook.ask_liquidity,
+            "spread_bps": orderbook.spread_bps,
+            "spread_usd": orderbook.spread_usd,
+            "imbalance": orderbook.imbalance,
+            "imbalance_label": "(bid pressure)" if orderbook.imbalance > 0 else "(ask pressure)" if orderbook.imbalance < 0 else "(balanced)",
+            "funding_rate": derivatives.funding_rate,
+            "funding_rate_annual": derivatives.funding_rate_annual,
+            "funding_trend": derivatives.funding_trend,
+            "time_to_funding": derivatives.time_to_funding,
+            "open_interest": derivatives.open_interest,
+            "oi_change_24h": derivatives.oi_change_24h,
+            "oi_trend": derivatives.oi_trend,
+            "long_short_ratio": derivatives.long_short_ratio,
+            "ratio_interpretation": derivatives.ratio_interpretation,
+            "total_value": portfolio.total_value,
+            "available_balance": portfolio.available_balance,
+            "used_margin": portfolio.used_margin,
+            "margin_usage_percent": portfolio.margin_usage_percent,
+            "exposure_percent": portfolio.exposure_percent,
+            "position_count": len(portfolio.positions),
+            "unrealized_pnl": portfolio.unrealized_pnl,
+            "realized_pnl_24h": portfolio.realized_pnl_24h,
+        })]
 
         # Add position details if any
         if portfolio.positions:
-            data_prompt += "\n## Current Positions:\n"
-            for pos in portfolio.positions:
-                data_prompt += f"- {pos.side} {pos.size} {pos.asset} @ ${pos.entry_price:.2f} (P&L: ${pos.unrealized_pnl:,.2f}, {pos.unrealized_pnl_percent:+.2f}%)\n"
+            parts.append("\n## Current Positions:\n")
+            parts.extend(
+                f"- {pos.side} {pos.size} {pos.asset} @ ${pos.entry_price:.2f} (P&L: ${pos.unrealized_pnl:,.2f}, {pos.unrealized_pnl_percent:+.2f}%)\n"
+                for pos in portfolio.positions
+            )
         else:
-            data_prompt += "\n## Current Positions: None\n"
+            parts.append("\n## Current Positions: None\n")
 
-        # Add analysis request (concise, no CoT)
-        data_prompt += """
-Follow the system prompt. Output JSON only, strictly matching the schema. No chain-of-thought.
-"""
+        parts.append(_PROMPT_FOOTER)
 
-        return data_prompt
+        return "".join(parts)
 
     async def get_trading_decision(
         self,
@@ -216,7 +392,8 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
         indicators: Dict[str, TechnicalIndicators],
         orderbook: OrderbookData,
         derivatives: DerivativesData,
-        portfolio: Portfolio
+        portfolio: Portfolio,
+        system_prompt: Optional[str] = None
     ) -> Optional[TradingDecision]:
         """
         Get trading decision from DeepSeek AI.
@@ -228,48 +405,82 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
             orderbook: Orderbook data
             derivatives: Derivatives data
             portfolio: Portfolio status
+            system_prompt: Override for the cached system prompt (defaults to prompt.md)
 
         Returns:
             TradingDecision object or None if error
         """
         try:
-            # Load system prompt
-            system_prompt = self._load_system_prompt()
-
             # Generate data prompt
             user_prompt = self.generate_prompt(
                 asset, market_data, indicators, orderbook, derivatives, portfolio
             )
 
+            # The prebuilt message keeps the system prefix identical across requests
+            if system_prompt is None:
+                system_message = self._system_message
+            else:
+                system_message = {"role": "system", "content": system_prompt}
+
             logger.info(f"Requesting trading decision from DeepSeek for {asset}")
 
             # Call DeepSeek API
             response = await self.client.chat.completions.create(
                 model=self.config.model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    system_message,
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=self.config.temperature,
                 max_tokens=self.config.max_tokens,
-                response_format={"type": "json_object"}
+                response_format={"type": "json_object"},
+                stream=True,
+                stream_options={"include_usage": True}
             )
 
+            # Collect streamed tokens as they arrive
+            parts = []
+            usage = None
+            finish_reason = None
+            async for chunk in response:
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    parts.append(choice.delta.content or "")
+                    finish_reason = choice.finish_reason or finish_reason
+                if chunk.usage:
+                    usage = chunk.usage
+
+            if finish_reason == "length":
+                logger.warning(f"DeepSeek response for {asset} hit max_tokens={self.config.max_tokens} (raise DEEPSEEK_MAX_TOKENS)")
+
+            if usage:
+                logger.debug(
+                    f"DeepSeek prompt cache: {getattr(usage, 'prompt_cache_hit_tokens', 'n/a')} of "
+                    f"{usage.prompt_tokens} prompt tokens hit"
+                )
+
             # Parse response
-            content = response.choices[0].message.content
-            decision_data = json.loads(content)
+            content = "".join(parts)
+            decision_data = orjson.loads(content)
 
             logger.info(f"Received decision from DeepSeek: {decision_data.get('decision')} (confidence: {decision_data.get('confidence')})")
 
-            # Save detailed reasoning to separate log file
-            self._save_reasoning_log(asset, decision_data, response)
+            # Save detailed reasoning to separate log file (written by the log thread);
+            # HOLDs only get a summary line unless log_holds is enabled
+            try:
+                if decision_data.get("decision", "HOLD") in ("HOLD", "NO_ACTION") and not self.config.log_holds:
+                    self._append_hold_summary(asset, decision_data)
+                else:
+                    self._save_reasoning_log(asset, decision_data, response)
+            except Exception as e:
+                logger.error(f"Failed to format AI reasoning log: {e}")
 
             # Parse into TradingDecision object
             trading_decision = self._parse_decision(decision_data)
 
             return trading_decision
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse DeepSeek response: {e}")
             logger.debug(f"Response content: {content}")
             return None
@@ -279,6 +490,9 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 
     def _parse_decision(self, data: Dict[str, Any]) -> TradingDecision:
         """Parse JSON response into TradingDecision object."""
+        decision_type = data.get("decision", "HOLD")
+        evidence = data.get("evidence")
+
         # Parse market regime
         regime_data = data.get("market_regime", {})
         market_regime = MarketRegimeData(
@@ -290,34 +504,27 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
         # Parse confluence analysis
         confluence_data = data.get("confluence_analysis", {})
         confluence_analysis = ConfluenceAnalysis(
-            trend_score=confluence_data.get("trend_score", 0),
-            trend_details=confluence_data.get("trend_details", ""),
-            momentum_score=confluence_data.get("momentum_score", 0),
-            momentum_details=confluence_data.get("momentum_details", ""),
-            volume_score=confluence_data.get("volume_score", 0),
-            volume_details=confluence_data.get("volume_details", ""),
-            microstructure_score=confluence_data.get("microstructure_score", 0),
-            microstructure_details=confluence_data.get("microstructure_details", ""),
-            total_confluence=confluence_data.get("total_confluence", 0)
+            **{name: confluence_data.get(name, default) for name, default in _CONFLUENCE_DEFAULTS.items()}
         )
 
         # Parse indicators summary
+        summary_data = data.get("indicators_summary", {})
         indicators_summary = IndicatorsSummary(
-            trend=data.get("indicators_summary", {}).get("trend", {}),
-            momentum=data.get("indicators_summary", {}).get("momentum", {}),
-            volume=data.get("indicators_summary", {}).get("volume", {}),
-            volatility=data.get("indicators_summary", {}).get("volatility", {})
+            trend=summary_data.get("trend", {}),
+            momentum=summary_data.get("momentum", {}),
+            volume=summary_data.get("volume", {}),
+            volatility=summary_data.get("volatility", {})
         )
 
         # Parse suggested action (if present)
         # HOLD decisions should not have a suggested action
         suggested_action = None
-        if "suggested_action" in data and data["suggested_action"]:
+        action_data = data.get("suggested_action")
+        if action_data:
             # Only parse if this is not a HOLD decision
-            decision_type = data.get("decision", "HOLD")
-            if decision_type not in ["HOLD", "NO_ACTION"]:
+            if decision_type not in ("HOLD", "NO_ACTION"):
                 try:
-                    suggested_action = self._parse_suggested_action(data["suggested_action"])
+                    suggested_action = self._parse_suggested_action(action_data)
                 except Exception as e:
                     logger.warning(f"Failed to parse suggested_action: {e}. Setting to None.")
                     suggested_action = None
@@ -325,17 +532,8 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
         # Parse risk assessment
         risk_data = data.get("risk_assessment", {})
         risk_assessment = RiskAssessment(
-            overall_risk=risk_data.get("overall_risk", "MEDIUM"),
             risk_factors=risk_data.get("risk_factors", []),
-            edge_quality=risk_data.get("edge_quality", 0.5),
-            risk_reward_ratio=risk_data.get("risk_reward_ratio", 0.0),
-            expected_value=risk_data.get("expected_value", 0.0),
-            position_size_modifier=risk_data.get("position_size_modifier", 1.0),
-            slippage_estimate=risk_data.get("slippage_estimate", 0.0),
-            liquidity_check=risk_data.get("liquidity_check", "PASS"),
-            funding_impact=risk_data.get("funding_impact", 0.0),
-            margin_safety=risk_data.get("margin_safety", 100.0),
-            liquidation_distance_pct=risk_data.get("liquidation_distance_pct", 0.0)
+            **{name: risk_data.get(name, default) for name, default in _RISK_DEFAULTS.items()}
         )
 
         # Normalize setup_quality to internal enum values
@@ -349,7 +547,6 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
         reasoning_text = data.get("reasoning")
         if not reasoning_text:
             rationale = data.get("rationale")
-            evidence = data.get("evidence", [])
             bullets = "\n".join([f"- {e}" for e in evidence]) if evidence else ""
             reasoning_text = (rationale or "").strip()
             if bullets:
@@ -357,11 +554,11 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 
         # If key_factors missing but evidence provided, store as key_factors.evidence
         key_factors = data.get("key_factors")
-        if not key_factors and data.get("evidence"):
-            key_factors = {"evidence": data.get("evidence")}
+        if not key_factors and evidence:
+            key_factors = {"evidence": evidence}
 
         return TradingDecision(
-            decision=Decision(data.get("decision", "HOLD")),
+            decision=Decision(decision_type),
             setup_quality=SetupQuality(setup_quality_raw),
             confidence=data.get("confidence", 0.0),
             confluence_score=data.get("confluence_score", 0),
@@ -384,18 +581,12 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
         Supports both legacy shape with explicit stop_loss/take_profit_targets and
         the v2 concise shape with entry_level/invalidation_level/tp_levels.
         """
-        from src.utils.models import (
-            OrderType,
-            OrderSide,
-            StopLoss,
-            TakeProfitTarget,
-            TrailingStop
-        )
-
-        # v2 shape detection
-        if "entry_level" in action_data or "invalidation_level" in action_data:
-            entry_price = action_data.get("entry_level", 0.0)
-            invalidation = action_data.get("invalidation_level", 0.0)
+        # v2 shape detection (null levels count as missing)
+        entry_price = action_data.get("entry_level")
+        invalidation = action_data.get("invalidation_level")
+        if entry_price is not None or invalidation is not None:
+            entry_price = entry_price or 0.0
+            invalidation = invalidation or 0.0
             tp_levels = action_data.get("tp_levels", []) or []
             rr_snapshot = action_data.get("rr_snapshot", {})
 
@@ -406,16 +597,16 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
                 dollar_risk=0.0,
             )
 
-            tp_targets: list[TakeProfitTarget] = []
-            for i, price in enumerate(tp_levels[:3], start=1):
-                rr = rr_snapshot.get(f"tp{i}", 0.0)
-                tp_targets.append(TakeProfitTarget(
+            tp_targets = [
+                TakeProfitTarget(
                     target=i,
                     price=price,
                     percentage_to_close=33,
                     reasoning="level",
-                    rr_ratio=rr,
-                ))
+                    rr_ratio=rr_snapshot.get(f"tp{i}", 0.0),
+                )
+                for i, price in enumerate(tp_levels[:3], start=1)
+            ]
 
             trailing_stop = TrailingStop(
                 activate_at_rr=2.0,
@@ -445,17 +636,10 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
             dollar_risk=sl_data.get("dollar_risk", 0.0),
         )
 
-        tp_targets = []
-        for tp_data in action_data.get("take_profit_targets", []):
-            tp_targets.append(
-                TakeProfitTarget(
-                    target=tp_data.get("target", 1),
-                    price=tp_data.get("price", 0.0),
-                    percentage_to_close=tp_data.get("percentage_to_close", 100),
-                    reasoning=tp_data.get("reasoning", ""),
-                    rr_ratio=tp_data.get("rr_ratio", 1.0),
-                )
-            )
+        tp_targets = [
+            TakeProfitTarget(**{name: tp_data.get(name, default) for name, default in _TP_DEFAULTS.items()})
+            for tp_data in action_data.get("take_profit_targets", [])
+        ]
 
         ts_data = action_data.get("trailing_stop", {})
         trailing_stop = TrailingStop(
@@ -519,30 +703,31 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 
     def _save_reasoning_log(self, asset: str, decision_data: Dict[str, Any], response: Any) -> None:
         """
-        Save detailed AI reasoning to a separate log file for review.
+        Queue detailed AI reasoning for a separate log file for review.
 
         Args:
             asset: Trading asset
             decision_data: Parsed decision JSON
-            response: Full API response object
+            response: API response stream
         """
-        import os
-        from pathlib import Path
+        # Create filename with timestamp and asset
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d_%H-%M-%S")
+        log_file = _LOG_DIR / f"{timestamp}_{asset}.md"
 
-        # Create logs/ai_thinking directory if it doesn't exist
-        log_dir = Path("logs/ai_thinking")
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # Sub-dicts used several times below
+        regime = decision_data.get('market_regime', {})
+        indicators_summary = decision_data.get('indicators_summary', {})
 
-        # Create filename with timestamp and asset
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_file = log_dir / f"{timestamp}_{asset}.md"
+        # Compact raw dump (largest block of the file); pipe through `jq .` to pretty-print
+        raw_json = orjson.dumps(decision_data).decode()
 
         # Format the reasoning log
         log_content = f"""# DeepSeek AI Reasoning Log
 
 ## Metadata
 - **Asset**: {asset}
-- **Timestamp**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+- **Timestamp**: {now.isoformat(sep=" ", timespec="seconds")}
 - **Model**: {self.config.model}
 - **Decision**: {decision_data.get('decision', 'N/A')}
 - **Confidence**: {decision_data.get('confidence', 0):.2%}
@@ -554,9 +739,9 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 ## 🧠 AI Reasoning Process
 
 ### Market Regime Analysis
-**Primary Regime**: {decision_data.get('market_regime', {}).get('primary', 'N/A')}
-**Strength**: {decision_data.get('market_regime', {}).get('strength', 0):.2f}
-**Regime Aligned**: {decision_data.get('market_regime', {}).get('regime_aligned', False)}
+**Primary Regime**: {regime.get('primary', 'N/A')}
+**Strength**: {regime.get('strength', 0):.2f}
+**Regime Aligned**: {regime.get('regime_aligned', False)}
 
 ### Confluence Analysis
 {self._format_confluence_analysis(decision_data.get('confluence_analysis', {}))}
@@ -575,16 +760,16 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 ## 📊 Indicators Summary
 
 ### Trend Indicators
-{json.dumps(decision_data.get('indicators_summary', {}).get('trend', {}), indent=2)}
+{_pretty_json(indicators_summary.get('trend', {}))}
 
 ### Momentum Indicators
-{json.dumps(decision_data.get('indicators_summary', {}).get('momentum', {}), indent=2)}
+{_pretty_json(indicators_summary.get('momentum', {}))}
 
 ### Volume Analysis
-{json.dumps(decision_data.get('indicators_summary', {}).get('volume', {}), indent=2)}
+{_pretty_json(indicators_summary.get('volume', {}))}
 
 ### Volatility Metrics
-{json.dumps(decision_data.get('indicators_summary', {}).get('volatility', {}), indent=2)}
+{_pretty_json(indicators_summary.get('volatility', {}))}
 
 ---
 
@@ -599,7 +784,7 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 ---
 
 ## 🔮 Alternative Scenarios
-{json.dumps(decision_data.get('alternative_scenarios', {}), indent=2)}
+{_pretty_json(decision_data.get('alternative_scenarios', {}))}
 
 ---
 
@@ -610,7 +795,7 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 
 ## 🔢 Raw API Response
 ```json
-{json.dumps(decision_data, indent=2)}
+{raw_json}
 ```
 
 ---
@@ -618,11 +803,18 @@ Follow the system prompt. Output JSON only, strictly matching the schema. No cha
 **Generated by Hyperliquid Trading Bot powered by DeepSeek Reasoner**
 """
 
-        # Write to file
-        with open(log_file, 'w', encoding='utf-8') as f:
-            f.write(log_content)
+        # Hand off to the writer thread
+        self._log_queue.put((log_file, log_content, "w"))
 
-        logger.debug(f"Saved AI reasoning log to: {log_file}")
+    def _append_hold_summary(self, asset: str, decision_data: Dict[str, Any]) -> None:
+        """Append a one-line HOLD summary to the rolling holds log."""
+        reasoning = str(decision_data.get('reasoning') or decision_data.get('rationale') or '').replace("\n", " ")
+        line = (
+            f"{datetime.now().isoformat(sep=' ', timespec='seconds')} | {asset} | "
+            f"{decision_data.get('decision', 'HOLD')} | confidence {decision_data.get('confidence', 0)} | "
+            f"{reasoning[:200]}\n"
+        )
+        self._log_queue.put((_LOG_DIR / "holds.log", line, "a"))
 
     def _format_confluence_analysis(self, confluence: Dict[str, Any]) -> str:
         """Format confluence analysis for log."""
@@ -0,0 +1,95 @@
+"""Fixed-capacity OHLCV ring buffer per (symbol, timeframe)."""
+
+from typing import Optional
+
+import numpy as np
+
+from src.utils.models import Candles
+
+_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+class CandleRing:
+    """
+    Last ``capacity`` candles of one series as preallocated column arrays.
+
+    Every bar is written twice, at slot and slot + capacity, so the most recent
+    ``size`` bars are always one contiguous slice and view() never copies.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self._time = np.zeros(2 * capacity, dtype=np.int64)
+        self._ohlcv = np.zeros((len(_COLUMNS), 2 * capacity), dtype=np.float64)
+        self.size = 0
+        self.head = 0  # slot the next bar is written to
+
+    @property
+    def last_time(self) -> Optional[int]:
+        """Open time (ms) of the newest bar, or None if empty."""
+        if not self.size:
+            return None
+        return int(self._time[(self.head - 1) % self.capacity])
+
+    @property
+    def prev_time(self) -> Optional[int]:
+        """Open time (ms) of the bar before the newest, or None if fewer than two."""
+        if self.size < 2:
+            return None
+        return int(self._time[(self.head - 2) % self.capacity])
+
+    def _write(self, slot: int, time_ms: int, row: np.ndarray) -> None:
+        self._time[slot] = self._time[slot + self.capacity] = time_ms
+        self._ohlcv[:, slot] = self._ohlcv[:, slot + self.capacity] = row
+
+    def clear(self) -> None:
+        self.size = 0
+        self.head = 0
+
+    def merge(self, candles: Candles) -> None:
+        """
+        Merge freshly fetched candles (oldest first).
+
+        A bar with the newest stored open time replaces it (the forming candle),
+        newer bars are appended, older ones are ignored. If the fetched block
+        starts after the newest stored bar, continuity cannot be verified and
+        the buffer starts over from the block.
+
+        Args:
+            candles: Candle arrays from HyperliquidClient.get_candle_arrays
+        """
+        times = candles['time']
+        if not len(times):
+            return
+
+        last_time = self.last_time
+        if last_time is not None and times[0] > last_time:
+            self.clear()
+            last_time = None
+
+        rows = np.stack([candles[column] for column in _COLUMNS], axis=1)
+        for time_ms, row in zip(times.tolist(), rows):
+            if last_time is not None and time_ms < last_time:
+                continue
+            if time_ms == last_time:
+                self._write((self.head - 1) % self.capacity, time_ms, row)
+                continue
+
+            self._write(self.head, time_ms, row)
+            self.head = (self.head + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+            last_time = time_ms
+
+    def view(self) -> Candles:
+        """
+        Stored bars (oldest first) as contiguous array views.
+
+        The views are overwritten by later merges, so use them before the next
+        merge.
+        """
+        end = self.head + self.capacity
+        start = end - self.size
+        return Candles(
+            time=self._time[start:end],
+            **{column: self._ohlcv[i, start:end] for i, column in enumerate(_COLUMNS)}
+        )
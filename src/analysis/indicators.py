@@ -2,10 +2,38 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from loguru import logger
 
-from src.utils.models import MACD, BollingerBands, TechnicalIndicators
+from src.utils.models import MACD, BollingerBands, Candles, TechnicalIndicators
+from src.analysis.indicators_online import IncrementalIndicators
+
+
+def _wilder_smooth(values: np.ndarray, period: int) -> float:
+    """
+    Final value of Wilder's smoothing: SMA seed over the first period, then
+    avg = (avg * (period - 1) + x) / period for each remaining value.
+
+    That recurrence is an EMA with alpha=1/period, so it is evaluated in closed
+    form as the decayed seed plus one weighted dot product.
+    """
+    rest = values[period:]
+    decay = 1.0 - 1.0 / period
+    weights = decay ** np.arange(len(rest) - 1, -1, -1)
+    return float(values[:period].mean() * decay ** len(rest) + (rest @ weights) / period)
+
+
+def _true_ranges(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> np.ndarray:
+    """True range of every bar after the first."""
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+
+    prev_closes = closes[:-1]
+    return np.maximum(
+        highs[1:] - lows[1:],
+        np.maximum(np.abs(highs[1:] - prev_closes), np.abs(lows[1:] - prev_closes))
+    )
 
 
 class TechnicalAnalysis:
@@ -20,12 +48,12 @@ class TechnicalAnalysis:
     """
 
     @staticmethod
-    def calculate_rsi(prices: List[float], period: int = 14) -> float:
+    def calculate_rsi(prices: np.ndarray, period: int = 14) -> float:
         """
         Calculate RSI (Relative Strength Index).
 
         Args:
-            prices: List of closing prices
+            prices: Array of closing prices
             period: RSI period (default 14)
 
         Returns:
@@ -35,16 +63,11 @@ class TechnicalAnalysis:
             return 50.0  # Neutral if not enough data
 
         deltas = np.diff(prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
+        gains = np.where(deltas > 0, deltas, 0.0)
+        losses = np.where(deltas < 0, -deltas, 0.0)
 
-        # Calculate remaining periods using Wilder's smoothing
-        for i in range(period, len(deltas)):
-            avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-            avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+        avg_gain = _wilder_smooth(gains, period)
+        avg_loss = _wilder_smooth(losses, period)
 
         if avg_loss == 0:
             return 100.0
@@ -56,7 +79,7 @@ class TechnicalAnalysis:
 
     @staticmethod
     def calculate_macd(
-        prices: List[float],
+        prices: np.ndarray,
         fast_period: int = 12,
         slow_period: int = 26,
         signal_period: int = 9
@@ -65,7 +88,7 @@ class TechnicalAnalysis:
         Calculate MACD (Moving Average Convergence Divergence).
 
         Args:
-            prices: List of closing prices
+            prices: Array of closing prices
             fast_period: Fast EMA period
             slow_period: Slow EMA period
             signal_period: Signal line period
@@ -76,57 +99,58 @@ class TechnicalAnalysis:
         if len(prices) < slow_period + signal_period:
             return MACD(value=0.0, signal=0.0, histogram=0.0)
 
-        df = pd.DataFrame(prices, columns=['price'])
-
-        # Calculate EMAs
-        ema_fast = df['price'].ewm(span=fast_period, adjust=False).mean()
-        ema_slow = df['price'].ewm(span=slow_period, adjust=False).mean()
-
-        # MACD line
-        macd_line = ema_fast - ema_slow
-
-        # Signal line
-        signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-
-        # Histogram
-        histogram = macd_line - signal_line
+        # Single pass over the prices, carrying only the last value of each EMA
+        # (same recurrence as ewm(span, adjust=False), seeded with the first price)
+        alpha_fast = 2.0 / (fast_period + 1)
+        alpha_slow = 2.0 / (slow_period + 1)
+        alpha_signal = 2.0 / (signal_period + 1)
+
+        values = np.asarray(prices, dtype=np.float64).tolist()
+        ema_fast = ema_slow = values[0]
+        macd_line = signal_line = 0.0
+        for price in values[1:]:
+            ema_fast += alpha_fast * (price - ema_fast)
+            ema_slow += alpha_slow * (price - ema_slow)
+            macd_line = ema_fast - ema_slow
+            signal_line += alpha_signal * (macd_line - signal_line)
 
         return MACD(
-            value=float(macd_line.iloc[-1]),
-            signal=float(signal_line.iloc[-1]),
-            histogram=float(histogram.iloc[-1])
+            value=macd_line,
+            signal=signal_line,
+            histogram=macd_line - signal_line
         )
 
     @staticmethod
-    def calculate_ema(prices: List[float], period: int) -> float:
+    def calculate_ema(prices: np.ndarray, period: int) -> float:
         """
         Calculate EMA (Exponential Moving Average).
 
         Args:
-            prices: List of closing prices
+            prices: Array of closing prices
             period: EMA period
 
         Returns:
             EMA value
         """
         if len(prices) < period:
-            return float(np.mean(prices)) if prices else 0.0
+            return float(np.mean(prices)) if len(prices) else 0.0
 
-        df = pd.DataFrame(prices, columns=['price'])
-        ema = df['price'].ewm(span=period, adjust=False).mean()
+        series = pd.Series(np.asarray(prices, dtype=np.float64), copy=False)
+        ema = series.ewm(span=period, adjust=False).mean()
         return float(ema.iloc[-1])
 
     @staticmethod
-    def calculate_sma(prices: List[float], period: int) -> float:
+    def calculate_sma(prices: np.ndarray, period: int) -> float:
         """Calculate SMA (Simple Moving Average)."""
+        prices = np.asarray(prices, dtype=np.float64)
         if len(prices) < period:
-            return float(np.mean(prices)) if prices else 0.0
+            return float(prices.mean()) if len(prices) else 0.0
 
-        return float(np.mean(prices[-period:]))
+        return float(prices[-period:].mean())
 
     @staticmethod
     def calculate_bollinger_bands(
-        prices: List[float],
+        prices: np.ndarray,
         period: int = 20,
         std_dev: float = 2.0
     ) -> BollingerBands:
@@ -134,7 +158,7 @@ class TechnicalAnalysis:
         Calculate Bollinger Bands.
 
         Args:
-            prices: List of closing prices
+            prices: Array of closing prices
             period: Moving average period
             std_dev: Number of standard deviations
 
@@ -142,7 +166,7 @@ class TechnicalAnalysis:
             BollingerBands object
         """
         if len(prices) < period:
-            current_price = prices[-1] if prices else 0
+            current_price = prices[-1] if len(prices) else 0
             return BollingerBands(
                 upper=current_price,
                 middle=current_price,
@@ -151,23 +175,17 @@ class TechnicalAnalysis:
                 width=0.0
             )
 
-        df = pd.DataFrame(prices, columns=['price'])
-
-        # Middle band (SMA)
-        middle = df['price'].rolling(window=period).mean()
-
-        # Standard deviation
-        std = df['price'].rolling(window=period).std()
+        # Only the last window matters for the current bands
+        window = np.asarray(prices, dtype=np.float64)[-period:]
+        middle_val = float(window.mean())
+        std_val = float(window.std(ddof=1))
 
         # Upper and lower bands
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
+        upper_val = middle_val + (std_val * std_dev)
+        lower_val = middle_val - (std_val * std_dev)
 
         # %B (position within bands)
         current_price = prices[-1]
-        upper_val = float(upper.iloc[-1])
-        lower_val = float(lower.iloc[-1])
-        middle_val = float(middle.iloc[-1])
 
         if upper_val != lower_val:
             percent_b = (current_price - lower_val) / (upper_val - lower_val)
@@ -189,15 +207,50 @@ class TechnicalAnalysis:
         )
 
     @staticmethod
-    def calculate_atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> float:
+    def calculate_bollinger_series(
+        prices: np.ndarray,
+        period: int = 20,
+        std_dev: float = 2.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calculate the full Bollinger Band series (e.g. for charting).
+
+        Args:
+            prices: Array of closing prices
+            period: Moving average period
+            std_dev: Number of standard deviations
+
+        Returns:
+            Tuple of (upper, middle, lower) arrays; NaN until the first full window
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        middle = np.full(len(prices), np.nan)
+        std = np.full(len(prices), np.nan)
+
+        if len(prices) >= period:
+            windows = np.lib.stride_tricks.sliding_window_view(prices, period)
+            middle[period - 1:] = windows.mean(axis=1)
+            std[period - 1:] = windows.std(axis=1, ddof=1)
+
+        return middle + std * std_dev, middle, middle - std * std_dev
+
+    @staticmethod
+    def calculate_atr(
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        period: int = 14,
+        true_ranges: Optional[np.ndarray] = None
+    ) -> float:
         """
         Calculate ATR (Average True Range).
 
         Args:
-            highs: List of high prices
-            lows: List of low prices
-            closes: List of closing prices
+            highs: Array of high prices
+            lows: Array of low prices
+            closes: Array of closing prices
             period: ATR period
+            true_ranges: Precomputed true ranges for these bars, if available
 
         Returns:
             ATR value
@@ -205,31 +258,25 @@ class TechnicalAnalysis:
         if len(closes) < period + 1:
             return 0.0
 
-        true_ranges = []
-        for i in range(1, len(closes)):
-            high_low = highs[i] - lows[i]
-            high_close = abs(highs[i] - closes[i-1])
-            low_close = abs(lows[i] - closes[i-1])
-            true_range = max(high_low, high_close, low_close)
-            true_ranges.append(true_range)
-
-        # Wilder's smoothing
-        atr = np.mean(true_ranges[:period])
-        for i in range(period, len(true_ranges)):
-            atr = (atr * (period - 1) + true_ranges[i]) / period
+        if true_ranges is None:
+            true_ranges = _true_ranges(highs, lows, closes)
 
-        return atr
+        return _wilder_smooth(true_ranges, period)
 
     @staticmethod
     def calculate_adx(
-        highs: List[float],
-        lows: List[float],
-        closes: List[float],
-        period: int = 14
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        period: int = 14,
+        atr: Optional[float] = None
     ) -> Tuple[float, float, float]:
         """
         Calculate ADX (Average Directional Index).
 
+        Args:
+            atr: Precomputed ATR over the same bars and period, if available
+
         Returns:
             Tuple of (ADX, +DI, -DI)
         """
@@ -237,36 +284,21 @@ class TechnicalAnalysis:
             return 0.0, 0.0, 0.0
 
         # Calculate +DM and -DM
-        plus_dm = []
-        minus_dm = []
-
-        for i in range(1, len(highs)):
-            high_diff = highs[i] - highs[i-1]
-            low_diff = lows[i-1] - lows[i]
-
-            if high_diff > low_diff and high_diff > 0:
-                plus_dm.append(high_diff)
-            else:
-                plus_dm.append(0)
-
-            if low_diff > high_diff and low_diff > 0:
-                minus_dm.append(low_diff)
-            else:
-                minus_dm.append(0)
+        high_diff = np.diff(highs)
+        low_diff = -np.diff(lows)
+        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0.0)
+        minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0.0)
 
         # Calculate ATR
-        atr = TechnicalAnalysis.calculate_atr(highs, lows, closes, period)
+        if atr is None:
+            atr = TechnicalAnalysis.calculate_atr(highs, lows, closes, period)
 
         if atr == 0:
             return 0.0, 0.0, 0.0
 
         # Smooth +DM and -DM
-        plus_dm_smooth = np.mean(plus_dm[:period])
-        minus_dm_smooth = np.mean(minus_dm[:period])
-
-        for i in range(period, len(plus_dm)):
-            plus_dm_smooth = (plus_dm_smooth * (period - 1) + plus_dm[i]) / period
-            minus_dm_smooth = (minus_dm_smooth * (period - 1) + minus_dm[i]) / period
+        plus_dm_smooth = _wilder_smooth(plus_dm, period)
+        minus_dm_smooth = _wilder_smooth(minus_dm, period)
 
         # Calculate +DI and -DI
         plus_di = (plus_dm_smooth / atr) * 100
@@ -284,13 +316,13 @@ class TechnicalAnalysis:
         return adx, plus_di, minus_di
 
     @staticmethod
-    def calculate_vwap(prices: List[float], volumes: List[float]) -> float:
+    def calculate_vwap(prices: np.ndarray, volumes: np.ndarray) -> float:
         """
         Calculate VWAP (Volume Weighted Average Price).
 
         Args:
-            prices: List of typical prices (H+L+C)/3
-            volumes: List of volumes
+            prices: Array of typical prices (H+L+C)/3
+            volumes: Array of volumes
 
         Returns:
             VWAP value
@@ -298,22 +330,23 @@ class TechnicalAnalysis:
         if len(prices) != len(volumes) or len(prices) == 0:
             return 0.0
 
-        cumulative_pv = sum(p * v for p, v in zip(prices, volumes))
-        cumulative_volume = sum(volumes)
+        prices = np.asarray(prices, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        cumulative_volume = volumes.sum()
 
         if cumulative_volume == 0:
             return 0.0
 
-        return cumulative_pv / cumulative_volume
+        return float(prices @ volumes / cumulative_volume)
 
     @staticmethod
-    def calculate_obv(closes: List[float], volumes: List[float]) -> float:
+    def calculate_obv(closes: np.ndarray, volumes: np.ndarray) -> float:
         """
         Calculate OBV (On Balance Volume).
 
         Args:
-            closes: List of closing prices
-            volumes: List of volumes
+            closes: Array of closing prices
+            volumes: Array of volumes
 
         Returns:
             OBV value
@@ -321,26 +354,23 @@ class TechnicalAnalysis:
         if len(closes) < 2 or len(volumes) < 2:
             return 0.0
 
-        obv = 0.0
-        for i in range(1, len(closes)):
-            if closes[i] > closes[i-1]:
-                obv += volumes[i]
-            elif closes[i] < closes[i-1]:
-                obv -= volumes[i]
-
-        return obv
+        return float(np.dot(np.sign(np.diff(closes)), volumes[1:]))
 
     @staticmethod
     def calculate_supertrend(
-        highs: List[float],
-        lows: List[float],
-        closes: List[float],
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
         period: int = 10,
-        multiplier: float = 3.0
+        multiplier: float = 3.0,
+        true_ranges: Optional[np.ndarray] = None
     ) -> Tuple[float, str]:
         """
         Calculate Supertrend indicator.
 
+        Args:
+            true_ranges: Precomputed true ranges for these bars, if available
+
         Returns:
             Tuple of (supertrend_value, signal)
             Signal is "bullish" or "bearish"
@@ -348,18 +378,15 @@ class TechnicalAnalysis:
         if len(closes) < period + 1:
             return 0.0, "neutral"
 
-        atr = TechnicalAnalysis.calculate_atr(highs, lows, closes, period)
-
-        # Calculate basic upper and lower bands
-        hl_avg = [(h + l) / 2 for h, l in zip(highs, lows)]
+        atr = TechnicalAnalysis.calculate_atr(highs, lows, closes, period, true_ranges=true_ranges)
 
-        basic_upper = [avg + multiplier * atr for avg in hl_avg]
-        basic_lower = [avg - multiplier * atr for avg in hl_avg]
+        # Basic upper and lower bands; only the current bar's are used
+        hl_avg = (float(highs[-1]) + float(lows[-1])) / 2
+        upper_band = hl_avg + multiplier * atr
+        lower_band = hl_avg - multiplier * atr
 
         # Determine trend
         current_close = closes[-1]
-        upper_band = basic_upper[-1]
-        lower_band = basic_lower[-1]
 
         if current_close > upper_band:
             signal = "bullish"
@@ -371,7 +398,7 @@ class TechnicalAnalysis:
         return supertrend, signal
 
     @staticmethod
-    def detect_divergence(prices: List[float], indicator: List[float]) -> str:
+    def detect_divergence(prices: np.ndarray, indicator: np.ndarray) -> str:
         """
         Detect bullish or bearish divergence.
 
@@ -381,76 +408,103 @@ class TechnicalAnalysis:
         if len(prices) < 10 or len(indicator) < 10:
             return "none"
 
-        # Find recent peaks and troughs
-        price_peaks = []
-        price_troughs = []
-        indicator_peaks = []
-        indicator_troughs = []
+        prices = np.asarray(prices, dtype=np.float64)
+        indicator = np.asarray(indicator, dtype=np.float64)
 
-        for i in range(1, len(prices) - 1):
-            if prices[i] > prices[i-1] and prices[i] > prices[i+1]:
-                price_peaks.append((i, prices[i]))
-                indicator_peaks.append((i, indicator[i]))
-            elif prices[i] < prices[i-1] and prices[i] < prices[i+1]:
-                price_troughs.append((i, prices[i]))
-                indicator_troughs.append((i, indicator[i]))
+        # Find recent peaks and troughs from the signs of neighbouring changes
+        deltas = np.diff(prices)
+        rising = deltas[:-1] > 0
+        falling = deltas[:-1] < 0
+        peaks = np.flatnonzero(rising & (deltas[1:] < 0)) + 1
+        troughs = np.flatnonzero(falling & (deltas[1:] > 0)) + 1
 
         # Bullish divergence: price making lower lows, indicator making higher lows
-        if len(price_troughs) >= 2 and len(indicator_troughs) >= 2:
-            if price_troughs[-1][1] < price_troughs[-2][1] and indicator_troughs[-1][1] > indicator_troughs[-2][1]:
+        if len(troughs) >= 2:
+            last, prev = troughs[-1], troughs[-2]
+            if prices[last] < prices[prev] and indicator[last] > indicator[prev]:
                 return "bullish"
 
         # Bearish divergence: price making higher highs, indicator making lower highs
-        if len(price_peaks) >= 2 and len(indicator_peaks) >= 2:
-            if price_peaks[-1][1] > price_peaks[-2][1] and indicator_peaks[-1][1] < indicator_peaks[-2][1]:
+        if len(peaks) >= 2:
+            last, prev = peaks[-1], peaks[-2]
+            if prices[last] > prices[prev] and indicator[last] < indicator[prev]:
                 return "bearish"
 
         return "none"
 
     @staticmethod
-    async def calculate_all_indicators(
-        candles: List[dict],
-        timeframe: str = "1h"
+    def calculate_all_indicators(
+        candles: Candles,
+        timeframe: str = "1h",
+        state: Optional[IncrementalIndicators] = None
     ) -> TechnicalIndicators:
         """
         Calculate all technical indicators from candle data.
 
         Args:
-            candles: List of candle dictionaries with OHLCV data
+            candles: Candle column arrays (see HyperliquidClient.get_candle_arrays)
             timeframe: Timeframe of the candles
+            state: Optional online indicator state for this symbol/timeframe;
+                RSI, MACD, EMAs, Bollinger Bands, ATR and the daily VWAP are
+                then advanced incrementally instead of recomputed over the
+                whole history
 
         Returns:
             TechnicalIndicators object with all calculated indicators
         """
-        if not candles or len(candles) < 50:
-            logger.debug(f"Not enough candle data for {timeframe}: {len(candles)}")
+        closes = candles['close']
+        if len(closes) < 50:
+            logger.debug(f"Not enough candle data for {timeframe}: {len(closes)}")
+            return TechnicalIndicators()
+
+        highs = candles['high']
+        lows = candles['low']
+        volumes = candles['volume']
+
+        if not (
+            np.isfinite(closes).all() and np.isfinite(highs).all()
+            and np.isfinite(lows).all() and np.isfinite(volumes).all()
+        ):
+            logger.warning(f"Non-finite candle data for {timeframe}, skipping indicators")
             return TechnicalIndicators()
 
-        # Extract OHLCV data
-        opens = [float(c['open']) for c in candles]
-        highs = [float(c['high']) for c in candles]
-        lows = [float(c['low']) for c in candles]
-        closes = [float(c['close']) for c in candles]
-        volumes = [float(c['volume']) for c in candles]
+        # Same window with an unchanged last bar: reuse the previous result
+        cache_key = None
+        if state is not None:
+            times = candles['time']
+            cache_key = (
+                timeframe, int(times[0]), int(times[-1]),
+                float(highs[-1]), float(lows[-1]), float(closes[-1]), float(volumes[-1])
+            )
+            if cache_key == state.result_key:
+                logger.debug(f"Reusing indicators for {timeframe}")
+                return state.result
 
         indicators = TechnicalIndicators()
 
-        # RSI
+        # One handler for the whole pass; stage names the indicator that failed
+        stage = "incremental indicators"
         try:
+            online = None
+            if state is not None:
+                state.update(candles)
+                online = state.current(candles)
+
+            # RSI
+            stage = "RSI"
+            rsi = online['rsi'] if online else TechnicalAnalysis.calculate_rsi(closes)
             if timeframe == "5m":
-                indicators.rsi_5m = TechnicalAnalysis.calculate_rsi(closes)
+                indicators.rsi_5m = rsi
             elif timeframe == "15m":
-                indicators.rsi_15m = TechnicalAnalysis.calculate_rsi(closes)
+                indicators.rsi_15m = rsi
             elif timeframe == "1h":
-                indicators.rsi_1h = TechnicalAnalysis.calculate_rsi(closes)
+                indicators.rsi_1h = rsi
             elif timeframe == "4h":
-                indicators.rsi_4h = TechnicalAnalysis.calculate_rsi(closes)
-        except Exception as e:
-            logger.error(f"Error calculating RSI: {e}")
+                indicators.rsi_4h = rsi
 
-        # MACD
-        try:
-            macd = TechnicalAnalysis.calculate_macd(closes)
+            # MACD
+            stage = "MACD"
+            macd = online['macd'] if online else TechnicalAnalysis.calculate_macd(closes)
             if timeframe == "5m":
                 indicators.macd_5m = macd
             elif timeframe == "1h":
@@ -459,83 +513,113 @@ class TechnicalAnalysis:
                 indicators.macd_4h = macd
             else:
                 indicators.macd = macd
-        except Exception as e:
-            logger.error(f"Error calculating MACD: {e}")
 
-        # EMAs
-        try:
-            indicators.ema_9 = TechnicalAnalysis.calculate_ema(closes, 9)
-            indicators.ema_20 = TechnicalAnalysis.calculate_ema(closes, 20)
-            indicators.ema_50 = TechnicalAnalysis.calculate_ema(closes, 50)
-            indicators.ema_200 = TechnicalAnalysis.calculate_ema(closes, 200)
-        except Exception as e:
-            logger.error(f"Error calculating EMAs: {e}")
+            # EMAs
+            stage = "EMAs"
+            if online:
+                indicators.ema_9 = online['ema_9']
+                indicators.ema_20 = online['ema_20']
+                indicators.ema_50 = online['ema_50']
+                indicators.ema_200 = online['ema_200']
+            else:
+                indicators.ema_9 = TechnicalAnalysis.calculate_ema(closes, 9)
+                indicators.ema_20 = TechnicalAnalysis.calculate_ema(closes, 20)
+                indicators.ema_50 = TechnicalAnalysis.calculate_ema(closes, 50)
+                indicators.ema_200 = TechnicalAnalysis.calculate_ema(closes, 200)
+
+            # One 14-period ATR (the online one when a state is kept) is shared by
+            # atr, atr_percent and ADX; Supertrend reuses the true ranges for its own period
+            stage = "ATR"
+            true_ranges = _true_ranges(highs, lows, closes)
+            if online:
+                atr = online['atr']
+            else:
+                atr = TechnicalAnalysis.calculate_atr(highs, lows, closes, 14, true_ranges=true_ranges)
+            indicators.atr = atr
+            if closes[-1] > 0:
+                indicators.atr_percent = (atr / closes[-1]) * 100
 
-        # ADX
-        try:
-            adx, plus_di, minus_di = TechnicalAnalysis.calculate_adx(highs, lows, closes)
+            # ADX
+            stage = "ADX"
+            adx, plus_di, minus_di = TechnicalAnalysis.calculate_adx(highs, lows, closes, atr=atr)
             indicators.adx = adx
             indicators.plus_di = plus_di
             indicators.minus_di = minus_di
-        except Exception as e:
-            logger.error(f"Error calculating ADX: {e}")
 
-        # Bollinger Bands
-        try:
-            indicators.bollinger_bands = TechnicalAnalysis.calculate_bollinger_bands(closes)
-        except Exception as e:
-            logger.error(f"Error calculating Bollinger Bands: {e}")
-
-        # ATR
-        try:
-            atr = TechnicalAnalysis.calculate_atr(highs, lows, closes)
-            indicators.atr = atr
-            if closes[-1] > 0:
-                indicators.atr_percent = (atr / closes[-1]) * 100
-        except Exception as e:
-            logger.error(f"Error calculating ATR: {e}")
+            # Bollinger Bands
+            stage = "Bollinger Bands"
+            if online:
+                indicators.bollinger_bands = online['bollinger_bands']
+            else:
+                indicators.bollinger_bands = TechnicalAnalysis.calculate_bollinger_bands(closes)
 
-        # Supertrend
-        try:
-            supertrend, signal = TechnicalAnalysis.calculate_supertrend(highs, lows, closes)
+            # Supertrend
+            stage = "Supertrend"
+            supertrend, signal = TechnicalAnalysis.calculate_supertrend(
+                highs, lows, closes, true_ranges=true_ranges
+            )
             indicators.supertrend = supertrend
             indicators.supertrend_signal = signal
-        except Exception as e:
-            logger.error(f"Error calculating Supertrend: {e}")
 
-        # VWAP
-        try:
-            typical_prices = [(h + l + c) / 3 for h, l, c in zip(highs, lows, closes)]
-            indicators.vwap_daily = TechnicalAnalysis.calculate_vwap(typical_prices, volumes)
-        except Exception as e:
-            logger.error(f"Error calculating VWAP: {e}")
+            # VWAP
+            stage = "VWAP"
+            if online:
+                indicators.vwap_daily = online['vwap']
+            else:
+                typical_prices = (highs + lows + closes) / 3
+                indicators.vwap_daily = TechnicalAnalysis.calculate_vwap(typical_prices, volumes)
 
-        # OBV
-        try:
-            obv = TechnicalAnalysis.calculate_obv(closes, volumes)
+            # OBV: running sum, so the current and 20-bars-ago values share one pass
+            stage = "OBV"
+            obv_cum = np.concatenate(([0.0], np.cumsum(np.sign(np.diff(closes)) * volumes[1:])))
+            obv = float(obv_cum[-1])
             indicators.obv = obv
 
             # Determine OBV trend
-            if len(candles) >= 20:
-                obv_20_ago = TechnicalAnalysis.calculate_obv(closes[:-20], volumes[:-20])
+            if len(closes) >= 21:
+                obv_20_ago = obv_cum[-21]
                 if obv > obv_20_ago * 1.05:
                     indicators.obv_trend = "uptrend"
                 elif obv < obv_20_ago * 0.95:
                     indicators.obv_trend = "downtrend"
                 else:
                     indicators.obv_trend = "neutral"
-        except Exception as e:
-            logger.error(f"Error calculating OBV: {e}")
 
-        # Volume ratio
-        try:
-            if len(volumes) >= 20:
-                avg_volume = np.mean(volumes[-20:])
-                current_volume = volumes[-1]
-                if avg_volume > 0:
-                    indicators.volume_ratio = current_volume / avg_volume
+            # Volume ratio
+            stage = "volume ratio"
+            avg_volume = volumes[-20:].mean()
+            if avg_volume > 0:
+                indicators.volume_ratio = volumes[-1] / avg_volume
         except Exception as e:
-            logger.error(f"Error calculating volume ratio: {e}")
+            logger.error(f"Error calculating {stage} for {timeframe}: {e}")
+            return TechnicalIndicators()
+
+        if state is not None:
+            state.result_key = cache_key
+            state.result = indicators
 
         logger.debug(f"Calculated indicators for {timeframe}")
         return indicators
+
+    @staticmethod
+    def calculate_multi_timeframe(
+        candles_by_timeframe: Dict[str, Candles],
+        states: Optional[Dict[str, IncrementalIndicators]] = None
+    ) -> Dict[str, TechnicalIndicators]:
+        """
+        Calculate indicators for several timeframes of one asset in a single call.
+
+        Args:
+            candles_by_timeframe: Candle arrays keyed by timeframe
+            states: Optional online indicator state keyed by timeframe
+
+        Returns:
+            TechnicalIndicators keyed by timeframe
+        """
+        states = states or {}
+        return {
+            timeframe: TechnicalAnalysis.calculate_all_indicators(
+                candles, timeframe, state=states.get(timeframe)
+            )
+            for timeframe, candles in candles_by_timeframe.items()
+        }
@@ -0,0 +1,332 @@
+"""Incremental (online) technical indicators.
+
+Each indicator keeps just enough state to advance by one bar in O(1):
+- update() commits a closed bar
+- peek() returns the value as if a bar were appended, without committing it,
+  which is how the still-forming last candle is evaluated every cycle
+
+Values are seeded from the first window of history and then carried forward,
+so they follow the full observed series instead of only the fetched window.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from src.utils.models import MACD, BollingerBands, Candles, TechnicalIndicators
+
+_MS_PER_DAY = 86_400_000
+
+
+class OnlineEMA:
+    """EMA with pandas ``ewm(span=period, adjust=False)`` semantics.
+
+    Until ``period`` bars have been seen the plain mean is reported, matching
+    ``TechnicalAnalysis.calculate_ema``.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.ema: Optional[float] = None
+        self.count = 0
+        self.total = 0.0
+
+    def _advance(self, price: float) -> Tuple[float, int, float]:
+        ema = price if self.ema is None else self.ema + self.alpha * (price - self.ema)
+        return ema, self.count + 1, self.total + price
+
+    def _value(self, ema: float, count: int, total: float) -> float:
+        return total / count if count < self.period else ema
+
+    def update(self, price: float) -> float:
+        self.ema, self.count, self.total = self._advance(price)
+        return self._value(self.ema, self.count, self.total)
+
+    def peek(self, price: float) -> float:
+        return self._value(*self._advance(price))
+
+
+class OnlineRSI:
+    """RSI with Wilder smoothing seeded by the SMA of the first ``period`` deltas."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev: Optional[float] = None
+        self.count = 0
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+
+    def _advance(self, price: float) -> Tuple[float, int, float, float]:
+        if self.prev is None:
+            return price, 0, 0.0, 0.0
+
+        delta = price - self.prev
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        count = self.count + 1
+        period = self.period
+
+        if count < period:
+            # Still seeding: accumulate sums
+            return price, count, self.avg_gain + gain, self.avg_loss + loss
+        if count == period:
+            return price, count, (self.avg_gain + gain) / period, (self.avg_loss + loss) / period
+        return (
+            price,
+            count,
+            (self.avg_gain * (period - 1) + gain) / period,
+            (self.avg_loss * (period - 1) + loss) / period
+        )
+
+    def _value(self, prev: float, count: int, avg_gain: float, avg_loss: float) -> float:
+        if count < self.period:
+            return 50.0  # Neutral if not enough data
+        if avg_loss == 0:
+            return 100.0
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def update(self, price: float) -> float:
+        self.prev, self.count, self.avg_gain, self.avg_loss = self._advance(price)
+        return self._value(self.prev, self.count, self.avg_gain, self.avg_loss)
+
+    def peek(self, price: float) -> float:
+        return self._value(*self._advance(price))
+
+
+class OnlineATR:
+    """ATR with Wilder smoothing seeded by the SMA of the first ``period`` true ranges."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.prev_close: Optional[float] = None
+        self.count = 0
+        self.atr = 0.0
+
+    def _advance(self, high: float, low: float, close: float) -> Tuple[float, int, float]:
+        if self.prev_close is None:
+            return close, 0, 0.0
+
+        true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        count = self.count + 1
+        period = self.period
+
+        if count < period:
+            return close, count, self.atr + true_range
+        if count == period:
+            return close, count, (self.atr + true_range) / period
+        return close, count, (self.atr * (period - 1) + true_range) / period
+
+    def _value(self, prev_close: float, count: int, atr: float) -> float:
+        return atr if count >= self.period else 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.prev_close, self.count, self.atr = self._advance(high, low, close)
+        return self._value(self.prev_close, self.count, self.atr)
+
+    def peek(self, high: float, low: float, close: float) -> float:
+        return self._value(*self._advance(high, low, close))
+
+
+class OnlineMACD:
+    """MACD built from fast/slow EMAs and an EMA signal line over the MACD line."""
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        self.alpha_fast = 2.0 / (fast_period + 1)
+        self.alpha_slow = 2.0 / (slow_period + 1)
+        self.alpha_signal = 2.0 / (signal_period + 1)
+        self.min_count = slow_period + signal_period
+        self.ema_fast: Optional[float] = None
+        self.ema_slow = 0.0
+        self.signal = 0.0
+        self.count = 0
+
+    def _advance(self, price: float) -> Tuple[float, float, float, int]:
+        if self.ema_fast is None:
+            # First bar: both EMAs start at the price, so the MACD line and signal are 0
+            return price, price, 0.0, 1
+
+        ema_fast = self.ema_fast + self.alpha_fast * (price - self.ema_fast)
+        ema_slow = self.ema_slow + self.alpha_slow * (price - self.ema_slow)
+        signal = self.signal + self.alpha_signal * ((ema_fast - ema_slow) - self.signal)
+        return ema_fast, ema_slow, signal, self.count + 1
+
+    def _value(self, ema_fast: float, ema_slow: float, signal: float, count: int) -> MACD:
+        if count < self.min_count:
+            return MACD(value=0.0, signal=0.0, histogram=0.0)
+        macd_line = ema_fast - ema_slow
+        return MACD(value=macd_line, signal=signal, histogram=macd_line - signal)
+
+    def update(self, price: float) -> MACD:
+        self.ema_fast, self.ema_slow, self.signal, self.count = self._advance(price)
+        return self._value(self.ema_fast, self.ema_slow, self.signal, self.count)
+
+    def peek(self, price: float) -> MACD:
+        return self._value(*self._advance(price))
+
+
+class OnlineBollinger:
+    """Bollinger Bands over a sliding window with Welford add/replace updates of mean and M2."""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.period = period
+        self.std_dev = std_dev
+        self.window: deque = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def _advance(self, price: float) -> Tuple[int, float, float]:
+        n = len(self.window)
+        if n < self.period:
+            # Window still filling: plain Welford step
+            n += 1
+            delta = price - self.mean
+            mean = self.mean + delta / n
+            return n, mean, self.m2 + delta * (price - mean)
+
+        # Full window: the new price replaces the oldest one
+        oldest = self.window[0]
+        mean = self.mean + (price - oldest) / n
+        return n, mean, self.m2 + (price - oldest) * (price - mean + oldest - self.mean)
+
+    def _value(self, price: float, n: int, mean: float, m2: float) -> BollingerBands:
+        if n < self.period:
+            return BollingerBands(upper=price, middle=price, lower=price, percent_b=0.5, width=0.0)
+
+        std = math.sqrt(max(m2 / (n - 1), 0.0))
+        upper = mean + std * self.std_dev
+        lower = mean - std * self.std_dev
+
+        percent_b = (price - lower) / (upper - lower) if upper != lower else 0.5
+        width = ((upper - lower) / mean) * 100 if mean != 0 else 0.0
+
+        return BollingerBands(upper=upper, middle=mean, lower=lower, percent_b=percent_b, width=width)
+
+    def update(self, price: float) -> BollingerBands:
+        n, self.mean, self.m2 = self._advance(price)
+        self.window.append(price)
+        if len(self.window) > self.period:
+            self.window.popleft()
+        return self._value(price, n, self.mean, self.m2)
+
+    def peek(self, price: float) -> BollingerBands:
+        return self._value(price, *self._advance(price))
+
+
+class OnlineVWAP:
+    """Session VWAP from running price*volume and volume sums, reset at each UTC day."""
+
+    def __init__(self):
+        self.day: Optional[int] = None
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+
+    def _advance(self, time_ms: int, price: float, volume: float) -> Tuple[int, float, float]:
+        day = time_ms // _MS_PER_DAY
+        if day != self.day:
+            return day, price * volume, volume
+        return day, self.cum_pv + price * volume, self.cum_v + volume
+
+    def _value(self, day: int, cum_pv: float, cum_v: float) -> float:
+        return cum_pv / cum_v if cum_v else 0.0
+
+    def update(self, time_ms: int, price: float, volume: float) -> float:
+        self.day, self.cum_pv, self.cum_v = self._advance(time_ms, price, volume)
+        return self._value(self.day, self.cum_pv, self.cum_v)
+
+    def peek(self, time_ms: int, price: float, volume: float) -> float:
+        return self._value(*self._advance(time_ms, price, volume))
+
+
+class IncrementalIndicators:
+    """
+    Online indicator state for one (symbol, timeframe) candle series.
+
+    Only closed candles are committed; the last candle of each fetch is treated
+    as still forming and evaluated with peek(). If the fetched window no longer
+    overlaps the committed history (gap, restart), the state is reseeded.
+    """
+
+    def __init__(self):
+        # Last full result and the window it was computed for
+        self.result_key: Optional[tuple] = None
+        self.result: Optional[TechnicalIndicators] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self.last_time: Optional[int] = None
+        self.rsi = OnlineRSI(14)
+        self.macd = OnlineMACD(12, 26, 9)
+        self.ema_9 = OnlineEMA(9)
+        self.ema_20 = OnlineEMA(20)
+        self.ema_50 = OnlineEMA(50)
+        self.ema_200 = OnlineEMA(200)
+        self.bollinger = OnlineBollinger(20, 2.0)
+        self.atr = OnlineATR(14)
+        self.vwap = OnlineVWAP()
+
+    def _commit(self, time_ms: int, high: float, low: float, close: float, volume: float) -> None:
+        self.rsi.update(close)
+        self.macd.update(close)
+        self.ema_9.update(close)
+        self.ema_20.update(close)
+        self.ema_50.update(close)
+        self.ema_200.update(close)
+        self.bollinger.update(close)
+        self.atr.update(high, low, close)
+        self.vwap.update(time_ms, (high + low + close) / 3, volume)
+        self.last_time = time_ms
+
+    def update(self, candles: Candles) -> None:
+        """
+        Commit every closed candle newer than the last committed one.
+
+        Args:
+            candles: Candle arrays (oldest first)
+        """
+        closed_times = candles['time'][:-1]
+        start = 0
+
+        if self.last_time is not None:
+            start = int(np.searchsorted(closed_times, self.last_time, side='right'))
+            if start == 0:
+                # No overlap with committed history: start over
+                self._reset()
+
+        end = len(closed_times)
+        for bar in zip(
+            closed_times[start:].tolist(),
+            candles['high'][start:end].tolist(),
+            candles['low'][start:end].tolist(),
+            candles['close'][start:end].tolist(),
+            candles['volume'][start:end].tolist()
+        ):
+            self._commit(*bar)
+
+    def current(self, candles: Candles) -> Dict[str, object]:
+        """
+        Indicator values with the (possibly forming) last candle applied on top.
+
+        Args:
+            candles: Candle arrays (oldest first)
+
+        Returns:
+            Dict with rsi, macd, ema_9/20/50/200, bollinger_bands, atr and vwap
+        """
+        time_ms = int(candles['time'][-1])
+        high = float(candles['high'][-1])
+        low = float(candles['low'][-1])
+        close = float(candles['close'][-1])
+        return {
+            'rsi': self.rsi.peek(close),
+            'macd': self.macd.peek(close),
+            'ema_9': self.ema_9.peek(close),
+            'ema_20': self.ema_20.peek(close),
+            'ema_50': self.ema_50.peek(close),
+            'ema_200': self.ema_200.peek(close),
+            'bollinger_bands': self.bollinger.peek(close),
+            'atr': self.atr.peek(high, low, close),
+            'vwap': self.vwap.peek(time_ms, (high + low + close) / 3, float(candles['volume'][-1])),
+        }
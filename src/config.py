@@ -1,15 +1,32 @@
 """Configuration management for the trading bot."""
 
+import functools
 import os
-from typing import Optional
+import re
+import sys
+from typing import Any, Dict, Optional, Tuple
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
 
+_CSV = re.compile(r"\s*,\s*")
 
-@dataclass
+
+def _csv(value: str) -> Optional[Tuple[str, ...]]:
+    """Parse a comma-separated env value into a tuple of non-empty interned items (None if empty)."""
+    if not value:
+        return None
+    items = tuple(sys.intern(item) for item in _CSV.split(value.strip()) if item)
+    return items or None
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> bool:
+    """Load .env into os.environ once per process (cache_clear() to reload)."""
+    return load_dotenv()
+
+
+@dataclass(slots=True, frozen=True)
 class HyperliquidConfig:
     """Hyperliquid API configuration (Wallet-based)."""
 
@@ -19,6 +36,7 @@ class HyperliquidConfig:
     use_mainnet_data: bool = False  # Use mainnet data for analysis, testnet for trading
     base_url: str = "https://api.hyperliquid.xyz"
     testnet_url: str = "https://api.hyperliquid-testnet.xyz"
+    info_cache_ttl: float = 0.0  # Seconds to reuse public meta/allMids responses (opt-in, CLI scripts)
 
     @property
     def url(self) -> str:
@@ -33,7 +51,7 @@ class HyperliquidConfig:
         return self.testnet_url if self.testnet else self.base_url
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeepSeekConfig:
     """DeepSeek API configuration."""
 
@@ -41,26 +59,27 @@ class DeepSeekConfig:
     base_url: str = "https://api.deepseek.com"
     model: str = "deepseek-chat"
     temperature: float = 0.1  # Low temperature for consistent trading decisions
-    max_tokens: int = 1500  # Reduced for token efficiency
+    max_tokens: int = 1200  # Decision JSON is bounded; truncations are logged as warnings
     multi_agent_enabled: bool = False  # Use multi-agent system (5 agents discussing)
+    log_holds: bool = False  # Full reasoning logs for HOLD decisions (otherwise one summary line)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CopyTradingConfig:
     """Copy trading configuration."""
 
     enabled: bool = False
-    copy_wallets: list = None  # List of wallet addresses to copy
+    copy_wallets: Optional[Tuple[str, ...]] = None  # Wallet addresses to copy
     position_multiplier: float = 1.0  # Scale factor for copied positions
-    copy_only_assets: list = None  # Only copy trades for these assets
+    copy_only_assets: Optional[Tuple[str, ...]] = None  # Only copy trades for these assets
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradingConfig:
     """Trading strategy configuration."""
 
     # Multi-asset support
-    trading_assets: list = None  # List of assets to trade
+    trading_assets: Optional[Tuple[str, ...]] = None  # Assets to trade
     default_asset: str = "BTC"
 
     max_position_size: float = 10000.0  # Per asset
@@ -98,14 +117,14 @@ class TradingConfig:
     max_drawdown_threshold: float = 0.20
 
     # Timeframes for analysis
-    timeframes: list = None
+    timeframes: Optional[Tuple[str, ...]] = None
 
     def __post_init__(self):
         if self.timeframes is None:
-            self.timeframes = ["1m", "5m", "15m", "1h", "4h", "24h"]
+            object.__setattr__(self, "timeframes", ("1m", "5m", "15m", "1h", "4h", "24h"))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskConfig:
     """Risk management configuration."""
 
@@ -119,7 +138,7 @@ class RiskConfig:
     correlation_threshold: float = 0.7
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DatabaseConfig:
     """Database configuration."""
 
@@ -127,7 +146,7 @@ class DatabaseConfig:
     echo: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -138,7 +157,7 @@ class LoggingConfig:
     retention: str = "30 days"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VisionConfig:
     """Vision AI configuration (for YouTube livestream analysis)."""
 
@@ -147,7 +166,7 @@ class VisionConfig:
     model: str = "gpt-4-vision-preview"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class YouTubeLivestreamConfig:
     """YouTube livestream monitoring configuration."""
 
@@ -157,95 +176,177 @@ class YouTubeLivestreamConfig:
     signal_weight: float = 0.3  # How much to weight livestream signals (0-1)
 
 
+# Environment variables Config reads. Only these form the parse cache key, so a
+# variable missing here is never seen by _parse_settings.
+_ENV_KEYS = (
+    "HYPERLIQUID_WALLET_ADDRESS",
+    "HYPERLIQUID_PRIVATE_KEY",
+    "HYPERLIQUID_TESTNET",
+    "USE_MAINNET_DATA",
+    "DEEPSEEK_API_KEY",
+    "DEEPSEEK_BASE_URL",
+    "DEEPSEEK_MODEL",
+    "MULTI_AGENT_ENABLED",
+    "DEEPSEEK_MAX_TOKENS",
+    "DEEPSEEK_LOG_HOLDS",
+    "TRADING_ASSETS",
+    "DEFAULT_ASSET",
+    "MAX_POSITION_SIZE",
+    "RISK_PER_TRADE",
+    "MAX_EXPOSURE",
+    "TRADING_INTERVAL",
+    "MIN_CONFIDENCE",
+    "STOP_LOSS_PERCENT",
+    "TAKE_PROFIT_PERCENT",
+    "MIN_LIQUIDITY",
+    "MIN_RISK_REWARD",
+    "MAX_SPREAD_BPS",
+    "TRADE_COOLDOWN_MINUTES",
+    "AI_LATENCY_GUARD_MS",
+    "ADX_LOW_THRESHOLD",
+    "ADX_LOW_SIZE_CAP",
+    "COPY_TRADING_ENABLED",
+    "COPY_WALLETS",
+    "COPY_POSITION_MULTIPLIER",
+    "COPY_ONLY_ASSETS",
+    "MAX_DAILY_TRADES",
+    "MAX_CONCURRENT_POSITIONS",
+    "DATABASE_URL",
+    "DATABASE_ECHO",
+    "LOG_LEVEL",
+    "LOG_FILE",
+    "VISION_PROVIDER",
+    "OPENAI_API_KEY",
+    "YOUTUBE_LIVESTREAM_ENABLED",
+    "YOUTUBE_LIVESTREAM_URL",
+    "YOUTUBE_CAPTURE_INTERVAL",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_settings(settings: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """
+    Build the sub-configs from the set config variables.
+
+    Only the latest settings are kept: the sub-configs are frozen, so every
+    Config built from the same environment shares them.
+
+    Args:
+        settings: (name, value) pairs for the variables in _ENV_KEYS that are set
+
+    Returns:
+        Sub-configs by Config attribute name
+    """
+    env = dict(settings)
+    get = env.get
+
+    def env_bool(key: str, default: str = "false") -> bool:
+        return get(key, default).lower() == "true"
+
+    def env_float(key: str, default: str) -> float:
+        return float(get(key, default))
+
+    def env_int(key: str, default: str) -> int:
+        return int(get(key, default))
+
+    def env_str(key: str, default: str) -> str:
+        # Interned: small-cardinality values compared against on every cycle
+        return sys.intern(get(key, default))
+
+    hyperliquid = HyperliquidConfig(
+        wallet_address=get("HYPERLIQUID_WALLET_ADDRESS", ""),
+        private_key=get("HYPERLIQUID_PRIVATE_KEY", ""),
+        testnet=env_bool("HYPERLIQUID_TESTNET", "true"),
+        use_mainnet_data=env_bool("USE_MAINNET_DATA", "true")
+    )
+
+    deepseek = DeepSeekConfig(
+        api_key=get("DEEPSEEK_API_KEY", ""),
+        base_url=get("DEEPSEEK_BASE_URL", "https://api.deepseek.com"),
+        model=env_str("DEEPSEEK_MODEL", "deepseek-chat"),
+        multi_agent_enabled=env_bool("MULTI_AGENT_ENABLED"),
+        max_tokens=env_int("DEEPSEEK_MAX_TOKENS", "1200"),
+        log_holds=env_bool("DEEPSEEK_LOG_HOLDS")
+    )
+
+    trading = TradingConfig(
+        trading_assets=_csv(get("TRADING_ASSETS", "")),
+        default_asset=env_str("DEFAULT_ASSET", "BTC"),
+        max_position_size=env_float("MAX_POSITION_SIZE", "10000"),
+        risk_per_trade=env_float("RISK_PER_TRADE", "0.02"),
+        max_exposure=env_float("MAX_EXPOSURE", "0.7"),
+        trading_interval=env_int("TRADING_INTERVAL", "300"),
+        min_confidence=env_float("MIN_CONFIDENCE", "0.6"),
+        stop_loss_percent=env_float("STOP_LOSS_PERCENT", "0.05"),
+        take_profit_percent=env_float("TAKE_PROFIT_PERCENT", "0.08"),
+        min_volume_24h=env_float("MIN_LIQUIDITY", "1000000"),
+        min_risk_reward=env_float("MIN_RISK_REWARD", "2.2"),
+        max_spread_bps=env_float("MAX_SPREAD_BPS", "10.0"),
+        trade_cooldown_minutes=env_int("TRADE_COOLDOWN_MINUTES", "60"),
+        ai_latency_guard_ms=env_int("AI_LATENCY_GUARD_MS", "400"),
+        adx_low_threshold=env_float("ADX_LOW_THRESHOLD", "18.0"),
+        adx_low_size_cap=env_float("ADX_LOW_SIZE_CAP", "0.5"),
+    )
+
+    copy_trading = CopyTradingConfig(
+        enabled=env_bool("COPY_TRADING_ENABLED"),
+        copy_wallets=_csv(get("COPY_WALLETS", "")),
+        position_multiplier=env_float("COPY_POSITION_MULTIPLIER", "1.0"),
+        copy_only_assets=_csv(get("COPY_ONLY_ASSETS", ""))
+    )
+
+    risk = RiskConfig(
+        max_daily_trades=env_int("MAX_DAILY_TRADES", "10"),
+        max_concurrent_positions=env_int("MAX_CONCURRENT_POSITIONS", "3")
+    )
+
+    database = DatabaseConfig(
+        url=get("DATABASE_URL", "sqlite:///./trading_bot.db"),
+        echo=env_bool("DATABASE_ECHO")
+    )
+
+    logging = LoggingConfig(
+        level=env_str("LOG_LEVEL", "INFO"),
+        log_file=get("LOG_FILE", "logs/trading_bot.log")
+    )
+
+    vision = VisionConfig(
+        provider=env_str("VISION_PROVIDER", "openai"),
+        api_key=get("OPENAI_API_KEY", "")
+    )
+
+    youtube_livestream = YouTubeLivestreamConfig(
+        enabled=env_bool("YOUTUBE_LIVESTREAM_ENABLED"),
+        url=get("YOUTUBE_LIVESTREAM_URL", ""),
+        capture_interval=env_int("YOUTUBE_CAPTURE_INTERVAL", "60")
+    )
+
+    return {
+        "hyperliquid": hyperliquid,
+        "deepseek": deepseek,
+        "trading": trading,
+        "copy_trading": copy_trading,
+        "risk": risk,
+        "database": database,
+        "logging": logging,
+        "vision": vision,
+        "youtube_livestream": youtube_livestream,
+    }
+
+
 class Config:
     """Main configuration class."""
 
     def __init__(self):
-        self.hyperliquid = HyperliquidConfig(
-            wallet_address=os.getenv("HYPERLIQUID_WALLET_ADDRESS", ""),
-            private_key=os.getenv("HYPERLIQUID_PRIVATE_KEY", ""),
-            testnet=os.getenv("HYPERLIQUID_TESTNET", "true").lower() == "true",
-            use_mainnet_data=os.getenv("USE_MAINNET_DATA", "true").lower() == "true"
-        )
-
-        self.deepseek = DeepSeekConfig(
-            api_key=os.getenv("DEEPSEEK_API_KEY", ""),
-            base_url=os.getenv("DEEPSEEK_BASE_URL", "https://api.deepseek.com"),
-            model=os.getenv("DEEPSEEK_MODEL", "deepseek-chat"),
-            multi_agent_enabled=os.getenv("MULTI_AGENT_ENABLED", "false").lower() == "true"
-        )
-
-        # Parse trading assets (comma-separated list)
-        trading_assets_str = os.getenv("TRADING_ASSETS", "")
-        trading_assets = None
-        if trading_assets_str:
-            trading_assets = [asset.strip() for asset in trading_assets_str.split(",") if asset.strip()]
-
-        self.trading = TradingConfig(
-            trading_assets=trading_assets,
-            default_asset=os.getenv("DEFAULT_ASSET", "BTC"),
-            max_position_size=float(os.getenv("MAX_POSITION_SIZE", "10000")),
-            risk_per_trade=float(os.getenv("RISK_PER_TRADE", "0.02")),
-            max_exposure=float(os.getenv("MAX_EXPOSURE", "0.7")),
-            trading_interval=int(os.getenv("TRADING_INTERVAL", "300")),
-            min_confidence=float(os.getenv("MIN_CONFIDENCE", "0.6")),
-            stop_loss_percent=float(os.getenv("STOP_LOSS_PERCENT", "0.05")),
-            take_profit_percent=float(os.getenv("TAKE_PROFIT_PERCENT", "0.08")),
-            min_volume_24h=float(os.getenv("MIN_LIQUIDITY", "1000000")),
-            min_risk_reward=float(os.getenv("MIN_RISK_REWARD", "2.2")),
-            max_spread_bps=float(os.getenv("MAX_SPREAD_BPS", "10.0")),
-            trade_cooldown_minutes=int(os.getenv("TRADE_COOLDOWN_MINUTES", "60")),
-            ai_latency_guard_ms=int(os.getenv("AI_LATENCY_GUARD_MS", "400")),
-            adx_low_threshold=float(os.getenv("ADX_LOW_THRESHOLD", "18.0")),
-            adx_low_size_cap=float(os.getenv("ADX_LOW_SIZE_CAP", "0.5")),
-        )
-
-        # Parse copy trading wallets (comma-separated list)
-        copy_wallets_str = os.getenv("COPY_WALLETS", "")
-        copy_wallets = None
-        if copy_wallets_str:
-            copy_wallets = [wallet.strip() for wallet in copy_wallets_str.split(",") if wallet.strip()]
-
-        copy_only_assets_str = os.getenv("COPY_ONLY_ASSETS", "")
-        copy_only_assets = None
-        if copy_only_assets_str:
-            copy_only_assets = [asset.strip() for asset in copy_only_assets_str.split(",") if asset.strip()]
-
-        self.copy_trading = CopyTradingConfig(
-            enabled=os.getenv("COPY_TRADING_ENABLED", "false").lower() == "true",
-            copy_wallets=copy_wallets,
-            position_multiplier=float(os.getenv("COPY_POSITION_MULTIPLIER", "1.0")),
-            copy_only_assets=copy_only_assets
-        )
-
-        self.risk = RiskConfig(
-            max_daily_trades=int(os.getenv("MAX_DAILY_TRADES", "10")),
-            max_concurrent_positions=int(os.getenv("MAX_CONCURRENT_POSITIONS", "3"))
-        )
-
-        self.database = DatabaseConfig(
-            url=os.getenv("DATABASE_URL", "sqlite:///./trading_bot.db"),
-            echo=os.getenv("DATABASE_ECHO", "false").lower() == "true"
-        )
-
-        self.logging = LoggingConfig(
-            level=os.getenv("LOG_LEVEL", "INFO"),
-            log_file=os.getenv("LOG_FILE", "logs/trading_bot.log")
-        )
-
-        self.vision = VisionConfig(
-            provider=os.getenv("VISION_PROVIDER", "openai"),
-            api_key=os.getenv("OPENAI_API_KEY", "")
-        )
-
-        self.youtube_livestream = YouTubeLivestreamConfig(
-            enabled=os.getenv("YOUTUBE_LIVESTREAM_ENABLED", "false").lower() == "true",
-            url=os.getenv("YOUTUBE_LIVESTREAM_URL", ""),
-            capture_interval=int(os.getenv("YOUTUBE_CAPTURE_INTERVAL", "60"))
-        )
-
-    def validate(self) -> tuple[bool, list[str]]:
-        """Validate configuration and return errors if any."""
+        _load_env_once()
+
+        environ = os.environ
+        settings = tuple((key, environ[key]) for key in _ENV_KEYS if key in environ)
+        vars(self).update(_parse_settings(settings))
+
+    @functools.cached_property
+    def validation_errors(self) -> tuple[str, ...]:
+        """Configuration errors, computed once (settings do not change after construction)."""
         errors = []
 
         if not self.hyperliquid.wallet_address:
@@ -263,8 +364,23 @@ class Config:
         if self.trading.min_confidence < 0 or self.trading.min_confidence > 1:
             errors.append("MIN_CONFIDENCE must be between 0 and 1")
 
-        return len(errors) == 0, errors
+        return tuple(errors)
+
+    def validate(self) -> tuple[bool, tuple[str, ...]]:
+        """Validate configuration and return errors if any."""
+        errors = self.validation_errors
+        return not errors, errors
+
+
+# Global config instance, built on first access (PEP 562) so importing this
+# module for its dataclasses does not read .env or the environment
+_config: Optional[Config] = None
 
 
-# Global config instance
-config = Config()
+def __getattr__(name: str):
+    global _config
+    if name == "config":
+        if _config is None:
+            _config = Config()
+        return _config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
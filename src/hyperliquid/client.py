@@ -4,9 +4,11 @@ import asyncio
 import hashlib
 import json
 import time
-from typing import Optional, Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator
 from datetime import datetime, timedelta
 import aiohttp
+import numpy as np
 from loguru import logger
 from eth_account import Account
 from eth_account.messages import encode_defunct
@@ -23,8 +25,16 @@ from src.utils.models import (
     Position,
     Portfolio,
     DerivativesData,
+    Candles,
 )
 
+# Process-wide cache of public /info responses: (url, body) -> (fetched_at, response)
+# Shared across client instances so scripts run in one process reuse results.
+# Only enabled when info_cache_ttl > 0, and only for slow-changing request types;
+# live market data (candleSnapshot, l2Book, ...) is always fetched fresh.
+_CACHEABLE_INFO_TYPES = frozenset({"meta", "allMids"})
+_info_cache: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+
 
 class HyperliquidClient:
     """
@@ -125,6 +135,16 @@ class HyperliquidClient:
         url = f"{self.base_url}{endpoint}"
         headers = {"Content-Type": "application/json"}
 
+        # Serve repeated public /info queries from cache; user-specific state is always fetched fresh
+        cache_key = None
+        ttl = self.config.info_cache_ttl
+        if (ttl > 0 and method == "POST" and endpoint == "/info" and not authenticated
+                and data and data.get("type") in _CACHEABLE_INFO_TYPES):
+            cache_key = (url, json.dumps(data, sort_keys=True))
+            cached = _info_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
         # For authenticated requests, we need to sign the action
         if authenticated and data:
             nonce = int(time.time() * 1000)
@@ -140,7 +160,7 @@ class HyperliquidClient:
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as response:
                 response.raise_for_status()
-                return await response.json()
+                result = await response.json()
 
         except aiohttp.ClientError as e:
             logger.error(f"API request failed: {e}")
@@ -149,6 +169,14 @@ class HyperliquidClient:
             logger.error(f"API request timeout for {endpoint}")
             raise
 
+        if cache_key:
+            now = time.monotonic()
+            # Drop expired entries so the cache stays bounded by live keys
+            for key in [k for k, (fetched_at, _) in _info_cache.items() if now - fetched_at >= ttl]:
+                del _info_cache[key]
+            _info_cache[cache_key] = (now, result)
+        return result
+
     async def get_ticker(self, asset: str) -> Dict[str, Any]:
         """Get current ticker data for an asset."""
         endpoint = "/info"
@@ -219,26 +247,15 @@ class HyperliquidClient:
 
         return data
 
-    async def get_candles(
-        self,
+    @staticmethod
+    def _candle_snapshot_request(
         asset: str,
-        timeframe: str = "1h",
-        limit: int = 100,
-        start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
-        """
-        Get historical candle data.
-
-        Args:
-            asset: Asset symbol (e.g., "BTC")
-            timeframe: Candle timeframe (1m, 5m, 15m, 1h, 4h, 1d)
-            limit: Number of candles to retrieve
-            start_time: Start time for candles
-            end_time: End time for candles
-        """
-        endpoint = "/info"
-
+        timeframe: str,
+        limit: int,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """Build the candleSnapshot /info request body."""
         # Calculate end time (now) and start time based on limit
         end_ts = int(time.time() * 1000) if not end_time else int(end_time.timestamp() * 1000)
 
@@ -263,6 +280,29 @@ class HyperliquidClient:
             }
         }
 
+        return data
+
+    async def get_candles(
+        self,
+        asset: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get historical candle data.
+
+        Args:
+            asset: Asset symbol (e.g., "BTC")
+            timeframe: Candle timeframe (1m, 5m, 15m, 1h, 4h, 1d)
+            limit: Number of candles to retrieve
+            start_time: Start time for candles
+            end_time: End time for candles
+        """
+        endpoint = "/info"
+        data = self._candle_snapshot_request(asset, timeframe, limit, start_time, end_time)
+
         try:
             response = await self._request("POST", endpoint, data)
 
@@ -286,6 +326,48 @@ class HyperliquidClient:
 
         return []
 
+    async def get_candle_arrays(
+        self,
+        asset: str,
+        timeframe: str = "1h",
+        limit: int = 100,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None
+    ) -> Optional[Candles]:
+        """
+        Get historical candle data as column arrays for indicator calculation.
+
+        Same request as get_candles, but the response is parsed straight into
+        one float64 block whose columns are returned as views.
+
+        Returns:
+            Candles arrays, or None if the request failed
+        """
+        endpoint = "/info"
+        data = self._candle_snapshot_request(asset, timeframe, limit, start_time, end_time)
+
+        try:
+            response = await self._request("POST", endpoint, data)
+            if not isinstance(response, list):
+                return None
+
+            rows = response[-limit:]
+            ohlcv = np.array(
+                [(c['o'], c['h'], c['l'], c['c'], c['v']) for c in rows],
+                dtype=np.float64
+            ).reshape(-1, 5)
+            return Candles(
+                time=np.fromiter((c['t'] for c in rows), dtype=np.int64, count=len(rows)),
+                open=ohlcv[:, 0],
+                high=ohlcv[:, 1],
+                low=ohlcv[:, 2],
+                close=ohlcv[:, 3],
+                volume=ohlcv[:, 4]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get candles for {asset} {timeframe}: {e}")
+            return None
+
     async def get_orderbook(self, asset: str, depth: int = 20) -> OrderbookData:
         """Get orderbook data with depth."""
         endpoint = "/info"
@@ -736,3 +818,33 @@ class HyperliquidClient:
         except Exception as e:
             logger.error(f"Hyperliquid API health check failed: {e}")
             return False
+
+
+# Process-wide client shared by nested shared_client() users
+_shared_client: Optional[HyperliquidClient] = None
+_shared_users = 0
+
+
+@asynccontextmanager
+async def shared_client(config: HyperliquidConfig) -> AsyncIterator[HyperliquidClient]:
+    """
+    Use the process-wide HyperliquidClient, opening it on first entry.
+
+    Nested users (e.g. several CLI scripts driven by one parent coroutine) share
+    the same HTTP session and SDK objects; the client is closed when the
+    outermost user exits.
+    """
+    global _shared_client, _shared_users
+
+    if _shared_client is None:
+        _shared_client = HyperliquidClient(config)
+        await _shared_client.__aenter__()
+    _shared_users += 1
+
+    try:
+        yield _shared_client
+    finally:
+        _shared_users -= 1
+        if _shared_users == 0:
+            client, _shared_client = _shared_client, None
+            await client.__aexit__(None, None, None)
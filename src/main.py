@@ -2,18 +2,20 @@
 
 import asyncio
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from loguru import logger
 import sys
 
 from src.config import config
 from src.hyperliquid.client import HyperliquidClient
 from src.analysis.indicators import TechnicalAnalysis
+from src.analysis.indicators_online import IncrementalIndicators
+from src.analysis.candle_buffer import CandleRing
 from src.ai.deepseek_engine import DeepSeekEngine
 from src.risk.manager import RiskManager
 from src.risk.performance_tracker import PerformanceTracker
 from src.trading.position_manager import PositionManager
-from src.utils.models import TechnicalIndicators, Decision
+from src.utils.models import Candles, TechnicalIndicators, Decision
 
 
 class TradingBot:
@@ -67,6 +69,11 @@ class TradingBot:
         self.trading_interval = config.trading.trading_interval
         self.running = False
 
+        # Online indicator state per (asset, timeframe), advanced every cycle
+        self.indicator_state: Dict[Tuple[str, str], IncrementalIndicators] = {}
+        # Candle history per (asset, timeframe); later cycles only fetch the newest bars
+        self.candle_buffers: Dict[Tuple[str, str], CandleRing] = {}
+
         # Setup logging
         self._setup_logging()
 
@@ -82,7 +89,8 @@ class TradingBot:
             sys.stdout,
             format=config.logging.log_format,
             level=config.logging.level,
-            colorize=True
+            colorize=True,
+            enqueue=True  # Sink writes happen on a background thread
         )
 
         # File logging
@@ -92,7 +100,8 @@ class TradingBot:
             level=config.logging.level,
             rotation=config.logging.rotation,
             retention=config.logging.retention,
-            compression="zip"
+            compression="zip",
+            enqueue=True
         )
 
     async def start(self):
@@ -254,12 +263,19 @@ class TradingBot:
 
             # 4. Calculate technical indicators for all timeframes
             logger.info(f"Calculating technical indicators for {asset}...")
-            indicators: Dict[str, TechnicalIndicators] = {}
-
-            for timeframe in ["1h", "4h"]:  # Reduced timeframes for token efficiency (removed 5m)
-                candles = await self.hl_client.get_candles(asset, timeframe, limit=100)  # Reduced for token efficiency
-                if candles:
-                    indicators[timeframe] = await TechnicalAnalysis.calculate_all_indicators(candles, timeframe)
+            timeframes = ["1h", "4h"]  # Reduced timeframes for token efficiency (removed 5m)
+            candle_sets = await asyncio.gather(*(self._fetch_candles(asset, tf) for tf in timeframes))
+            candles_by_timeframe = {
+                tf: candles for tf, candles in zip(timeframes, candle_sets)
+                if candles is not None and len(candles['close'])
+            }
+            states = {
+                tf: self.indicator_state.setdefault((asset, tf), IncrementalIndicators())
+                for tf in candles_by_timeframe
+            }
+            indicators: Dict[str, TechnicalIndicators] = TechnicalAnalysis.calculate_multi_timeframe(
+                candles_by_timeframe, states
+            )
 
             # 5. Get AI decision (Single-Agent OR Multi-Agent)
             logger.info(f"Requesting AI trading decision for {asset}...")
@@ -359,6 +375,42 @@ class TradingBot:
         except Exception as e:
             logger.exception(f"Error in trading loop: {e}")
 
+    async def _fetch_candles(self, asset: str, timeframe: str) -> Optional[Candles]:
+        """
+        Get the last 100 candles for an asset/timeframe via its ring buffer.
+
+        While the buffer is not full (first call, or after a gap reset) the full
+        window is fetched. Once full, only bars from the second-newest stored bar
+        onward are fetched and merged in.
+        """
+        ring = self.candle_buffers.get((asset, timeframe))
+        if ring is None:
+            ring = self.candle_buffers[(asset, timeframe)] = CandleRing(capacity=100)  # Reduced for token efficiency
+
+        incremental = ring.size == ring.capacity
+        start_time = None
+        if incremental:
+            start_time = datetime.fromtimestamp(ring.prev_time / 1000)
+
+        candles = await self.hl_client.get_candle_arrays(asset, timeframe, limit=ring.capacity, start_time=start_time)
+        if candles is None:
+            return None
+
+        if not incremental:
+            # A full window replaces partial history (merge ignores bars older than the newest stored one)
+            ring.clear()
+        ring.merge(candles)
+
+        if incremental and ring.size < ring.capacity:
+            # The fetched block did not overlap (gap) and the buffer reset: refill the whole window now
+            candles = await self.hl_client.get_candle_arrays(asset, timeframe, limit=ring.capacity)
+            if candles is None:
+                return None
+            ring.clear()
+            ring.merge(candles)
+
+        return ring.view()
+
     async def execute_entry(self, asset: str, decision, portfolio, indicators: TechnicalIndicators):
         """Execute entry order or add to existing position."""
         try:
@@ -666,11 +718,16 @@ class TradingBot:
         logger.info("Stopping trading bot...")
         self.running = False
 
-        # Close session
+        # Close sessions
         if self.hl_client.session:
             await self.hl_client.session.close()
+        if self.trading_desk:
+            await self.trading_desk.close()
+        if self.ai_engine:
+            await self.ai_engine.aclose()
 
         logger.info("Trading bot stopped")
+        await logger.complete()
 
 
 async def main():
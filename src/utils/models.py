@@ -2,9 +2,11 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Literal
+from typing import Optional, Literal, TypedDict
 from enum import Enum
 
+import numpy as np
+
 
 class MarketRegime(str, Enum):
     """Market regime types."""
@@ -124,6 +126,17 @@ class BollingerBands:
     width: float
 
 
+class Candles(TypedDict):
+    """Candle series as column arrays (oldest first); time is the open time in ms."""
+
+    time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
 @dataclass
 class TechnicalIndicators:
     """Technical indicators for analysis."""
@@ -0,0 +1,115 @@
+"""Test that the candle ring buffer refills its full window after a reset or gap."""
+
+import asyncio
+import sys
+
+import numpy as np
+
+from src.analysis.candle_buffer import CandleRing
+from src.main import TradingBot
+from src.utils.models import Candles
+
+MS_PER_BAR = 300_000  # 5m
+
+
+class FakeCandleClient:
+    """Serves candle windows from an in-memory series like get_candle_arrays."""
+
+    def __init__(self, bars: int):
+        self.bars = bars
+        self.calls = 0
+        self.missing = None  # (start_ms, end_ms) of bars the exchange does not return
+
+    def get_series(self) -> Candles:
+        times = np.arange(self.bars, dtype=np.int64) * MS_PER_BAR
+        closes = 100.0 + np.arange(self.bars, dtype=np.float64)
+        return Candles(time=times, open=closes, high=closes + 1, low=closes - 1, close=closes, volume=np.ones(self.bars))
+
+    async def get_candle_arrays(self, asset, timeframe, limit=100, start_time=None, end_time=None):
+        self.calls += 1
+        series = self.get_series()
+        if self.missing is not None:
+            keep = (series['time'] < self.missing[0]) | (series['time'] >= self.missing[1])
+            series = Candles(**{column: values[keep] for column, values in series.items()})
+        start = 0
+        if start_time is not None:
+            start = int(np.searchsorted(series['time'], int(start_time.timestamp() * 1000)))
+        start = max(start, len(series['time']) - limit)
+        return Candles(**{column: values[start:] for column, values in series.items()})
+
+
+def make_bot(client: FakeCandleClient) -> TradingBot:
+    bot = TradingBot.__new__(TradingBot)
+    bot.hl_client = client
+    bot.candle_buffers = {}
+    return bot
+
+
+async def test_candle_buffer():
+    """Test CandleRing refill behaviour through TradingBot._fetch_candles."""
+
+    print("=" * 80)
+    print("TESTING CANDLE BUFFER")
+    print("=" * 80)
+
+    client = FakeCandleClient(bars=300)
+    bot = make_bot(client)
+
+    # Test 1: Empty buffer fetches the full window
+    candles = await bot._fetch_candles("BTC", "5m")
+    print(f"\n1. First fetch - Bars: {len(candles['close'])}")
+    assert len(candles['close']) == 100, "First fetch should fill the window"
+
+    # Test 2: Full buffer only fetches the newest bars and stays full
+    client.bars += 1
+    candles = await bot._fetch_candles("BTC", "5m")
+    print(f"2. Incremental fetch - Bars: {len(candles['close'])}, last close: {candles['close'][-1]}")
+    assert len(candles['close']) == 100, "Incremental fetch should keep the window full"
+    assert candles['close'][-1] == 100.0 + 300, "Newest bar should be appended"
+
+    # Test 3: A buffer left with only a few bars after a reset refills on the next fetch
+    ring = bot.candle_buffers[("BTC", "5m")]
+    ring.clear()
+    ring.merge(Candles(**{column: values[-6:] for column, values in client.get_series().items()}))
+    print(f"3. After reset - Bars in buffer: {ring.size}")
+    candles = await bot._fetch_candles("BTC", "5m")
+    print(f"   Next fetch - Bars: {len(candles['close'])}")
+    assert len(candles['close']) == 100, "Window should refill after a reset"
+
+    # Test 4: More new bars than the fetch limit replace the window in one fetch
+    client.bars += 150
+    calls_before = client.calls
+    candles = await bot._fetch_candles("BTC", "5m")
+    print(f"4. After long pause - Bars: {len(candles['close'])}, fetches: {client.calls - calls_before}")
+    assert len(candles['close']) == 100, "Window should stay full after a long pause"
+    assert np.all(np.diff(candles['time']) == MS_PER_BAR), "Window should be contiguous"
+    assert candles['close'][-1] == 100.0 + client.bars - 1, "Window should end at the newest bar"
+
+    # Test 5: A gap (fetched block starts after the newest stored bar) refills in the same cycle
+    last_time = ring.last_time
+    client.missing = (last_time - MS_PER_BAR, last_time + 2 * MS_PER_BAR)
+    client.bars += 5
+    calls_before = client.calls
+    candles = await bot._fetch_candles("BTC", "5m")
+    print(f"5. After gap - Bars: {len(candles['close'])}, fetches: {client.calls - calls_before}")
+    assert client.calls - calls_before == 2, "Gap should trigger one refill fetch"
+    assert len(candles['close']) == 100, "Window should refill after a gap"
+    assert candles['close'][-1] == 100.0 + client.bars - 1, "Refilled window should end at the newest bar"
+
+    # Test 6: A fresh ring reports no times until bars are merged
+    assert CandleRing(capacity=10).prev_time is None, "Empty ring has no prev_time"
+    print("6. Empty ring has no prev_time")
+
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(test_candle_buffer())
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
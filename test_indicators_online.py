@@ -0,0 +1,122 @@
+"""Test that incremental indicators match the stateless calculation."""
+
+import dataclasses
+import math
+import sys
+
+import numpy as np
+
+from src.analysis.indicators import TechnicalAnalysis
+from src.analysis.indicators_online import IncrementalIndicators
+from src.utils.models import Candles
+
+MS_PER_BAR = 3_600_000  # 1h
+WINDOW = 100
+
+# Fields the state computes online (VWAP is a daily session value there, so it is checked separately)
+ONLINE_FIELDS = (
+    'rsi_1h', 'macd_1h', 'ema_9', 'ema_20', 'ema_50', 'ema_200',
+    'bollinger_bands', 'atr', 'atr_percent', 'adx', 'plus_di', 'minus_di',
+)
+
+
+def make_series(bars: int, seed: int = 7) -> Candles:
+    """Random-walk 1h candles."""
+    rng = np.random.default_rng(seed)
+    closes = 100.0 * np.cumprod(1 + rng.normal(0, 0.01, bars))
+    opens = np.concatenate(([100.0], closes[:-1]))
+    return Candles(
+        time=np.arange(bars, dtype=np.int64) * MS_PER_BAR,
+        open=opens,
+        high=np.maximum(opens, closes) * 1.002,
+        low=np.minimum(opens, closes) * 0.998,
+        close=closes,
+        volume=rng.uniform(0, 1000, bars),
+    )
+
+
+def window(series: Candles, start: int, end: int) -> Candles:
+    """Copy of bars [start, end) of a series."""
+    return Candles(**{column: values[start:end].copy() for column, values in series.items()})
+
+
+def values_match(a, b) -> bool:
+    if dataclasses.is_dataclass(a):
+        return all(values_match(x, y) for x, y in zip(dataclasses.astuple(a), dataclasses.astuple(b)))
+    return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def mismatches(a, b, fields=ONLINE_FIELDS):
+    return [field for field in fields if not values_match(getattr(a, field), getattr(b, field))]
+
+
+def test_indicators_online():
+    """Test IncrementalIndicators through TechnicalAnalysis.calculate_all_indicators."""
+
+    print("=" * 80)
+    print("TESTING INCREMENTAL INDICATORS")
+    print("=" * 80)
+
+    series = make_series(400)
+    calc = TechnicalAnalysis.calculate_all_indicators
+
+    # Test 1: First call with a state equals the stateless calculation
+    first = window(series, 0, WINDOW)
+    with_state = calc(first, "1h", state=IncrementalIndicators())
+    stateless = calc(first, "1h")
+    diff = mismatches(with_state, stateless)
+    print(f"\n1. First call vs stateless - Mismatches: {diff}")
+    assert not diff, f"First call should match the stateless path: {diff}"
+
+    # Test 2: Updates of the forming bar are never committed
+    state = IncrementalIndicators()
+    calc(first, "1h", state=state)
+    for jitter in (1.01, 0.97, 1.005):
+        forming = window(series, 0, WINDOW)
+        forming['close'][-1] *= jitter
+        forming['high'][-1] = max(forming['high'][-1], forming['close'][-1])
+        forming['low'][-1] = min(forming['low'][-1], forming['close'][-1])
+        calc(forming, "1h", state=state)
+    final = window(series, 0, WINDOW)
+    final['close'][-1] *= 1.002
+    updated = calc(final, "1h", state=state)
+    fresh = calc(final, "1h", state=IncrementalIndicators())
+    diff = mismatches(updated, fresh, ONLINE_FIELDS + ('vwap_daily',))
+    print(f"2. Forming bar updates vs fresh state - Mismatches: {diff}")
+    assert not diff, f"Forming bar updates should not be committed: {diff}"
+
+    # Test 3: Sliding the window follows the whole observed series
+    state = IncrementalIndicators()
+    for end in range(WINDOW, 301):
+        slid = calc(window(series, end - WINDOW, end), "1h", state=state)
+    full = calc(window(series, 0, 300), "1h", state=IncrementalIndicators())
+    diff = mismatches(slid, full, ('rsi_1h', 'macd_1h', 'ema_9', 'ema_200', 'bollinger_bands', 'atr', 'vwap_daily'))
+    print(f"3. Sliding window vs full history - Mismatches: {diff}")
+    assert not diff, f"Sliding updates should match the full history: {diff}"
+
+    # Test 4: A window that no longer overlaps the committed history reseeds the state
+    after_gap = window(series, 300, 400)
+    reseeded = calc(after_gap, "1h", state=state)
+    fresh = calc(after_gap, "1h", state=IncrementalIndicators())
+    diff = mismatches(reseeded, fresh, ONLINE_FIELDS + ('vwap_daily',))
+    print(f"4. After gap vs fresh state - Mismatches: {diff}")
+    assert not diff, f"A gap should reseed the state: {diff}"
+
+    # Test 5: An unchanged window reuses the previous result
+    again = calc(window(series, 300, 400), "1h", state=state)
+    print(f"5. Unchanged window reuses result: {again is reseeded}")
+    assert again is reseeded, "Unchanged window should reuse the cached result"
+
+    print("\n" + "=" * 80)
+    print("✅ ALL TESTS PASSED")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    try:
+        test_indicators_online()
+    except Exception as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)